@@ -7,15 +7,24 @@ Stores results in a local SQLite database with deduplication.
 
 import sqlite3
 import hashlib
+import io
+import json
 import re
 import time
+import unicodedata
 import logging
-from datetime import datetime, timedelta
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from typing import Optional
 
 import feedparser
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -23,6 +32,8 @@ import yaml
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT / "config.yaml"
 DB_PATH = ROOT / "data" / "papers.db"
+OA_CACHE_PATH = ROOT / "data" / "oa_cache.json"
+OA_CACHE_TTL = 3600  # seconds; discovery queries are reused across same-day re-runs
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,12 +42,45 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+# Max journal feeds fetched in parallel
+FETCH_WORKERS = 6
+
+# Shared session so OpenAlex calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503]),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+_WS_RE = re.compile(r"\s+")
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+_RSS_NS = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "prism": "http://prismstandard.org/namespaces/basic/2.0/",
+}
+# feedparser's e-mail pattern for RSS <author> values like "jdoe@x.org (Jane Doe)"
+_RSS_EMAIL_RE = re.compile(
+    r"(([a-zA-Z0-9_\-.+]+)@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.)|"
+    r"(([a-zA-Z0-9\-]+\.)+))([a-zA-Z]{2,4}|[0-9]{1,3})(]?))(\?subject=\S+)?"
+)
+
 
 # ---------------------------------------------------------------------------
 # Database helpers
 # ---------------------------------------------------------------------------
 
 def init_db(conn: sqlite3.Connection):
+    # WAL + NORMAL drops the rollback-journal fsyncs on every commit; the rest
+    # keep the working set in memory. Only journal_mode persists in the file.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")     # 64 MB
+    conn.execute("PRAGMA mmap_size=268435456")   # 256 MB
     conn.execute("""
         CREATE TABLE IF NOT EXISTS papers (
             paper_id   TEXT PRIMARY KEY,
@@ -62,85 +106,241 @@ def init_db(conn: sqlite3.Connection):
             conn.execute(f"ALTER TABLE papers ADD COLUMN {col} {typedef}")
         except sqlite3.OperationalError:
             pass  # column already exists
+    # v2: paper_id is blake2b over NFKC-normalized, punctuation-free text
+    # (v1 only changed the hash). Feed rows are re-keyed so stored papers
+    # aren't re-inserted as new. JMP rows keep their ids; 05_fetch_jmp.py
+    # hashes those separately.
+    if conn.execute("PRAGMA user_version").fetchone()[0] < 2:
+        _rekey_paper_ids(conn)
+        conn.execute("PRAGMA user_version = 2")
     conn.execute("""
         CREATE INDEX IF NOT EXISTS idx_fetched ON papers(fetched_at)
     """)
     conn.execute("""
         CREATE INDEX IF NOT EXISTS idx_journal ON papers(journal)
     """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_source_fetched ON papers(source, fetched_at)
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_picked_journal ON papers(picked, journal)
+    """)
     conn.commit()
 
 
-def paper_exists(conn: sqlite3.Connection, paper_id: str) -> bool:
-    row = conn.execute(
-        "SELECT 1 FROM papers WHERE paper_id = ?", (paper_id,)
-    ).fetchone()
-    return row is not None
+def _rekey_paper_ids(conn: sqlite3.Connection):
+    """Recompute feed paper_ids with make_id(), merging rows that now collide."""
+    conn.create_function("make_id", 2, make_id, deterministic=True)
+    new_id = "make_id(title, COALESCE(authors, ''))"
+    conn.execute(f"UPDATE OR IGNORE papers SET paper_id = {new_id} WHERE source != 'jmp'")
+    # Rows left on a stale id are duplicates of a re-keyed row: carry over
+    # their picked flag, then drop them.
+    stale = f"source != 'jmp' AND paper_id != {new_id}"
+    conn.execute(
+        f"UPDATE papers SET picked = 1 WHERE paper_id IN "
+        f"(SELECT {new_id} FROM papers WHERE {stale} AND picked = 1)"
+    )
+    conn.execute(f"DELETE FROM papers WHERE {stale}")
 
 
-def insert_paper(conn: sqlite3.Connection, paper: dict):
-    conn.execute(
-        """INSERT OR IGNORE INTO papers
-           (paper_id, title, authors, abstract, journal, source, url, doi, oa_url, pub_date, fetched_at, relevant)
-           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-        (
-            paper["paper_id"],
-            paper["title"],
-            paper.get("authors", ""),
-            paper.get("abstract", ""),
-            paper.get("journal", ""),
-            paper.get("source", ""),
-            paper.get("url", ""),
-            paper.get("doi", ""),
-            paper.get("oa_url", ""),
-            paper.get("pub_date", ""),
-            datetime.now().isoformat(),
-            paper.get("relevant", 0),
-        ),
+_INSERT_COLS = (
+    "paper_id, title, authors, abstract, journal, source, url, doi, oa_url, "
+    "pub_date, fetched_at, relevant"
+)
+_ROW_PLACEHOLDER = "(" + ", ".join(["?"] * 12) + ")"
+INSERT_SQL = f"INSERT OR IGNORE INTO papers ({_INSERT_COLS}) VALUES {_ROW_PLACEHOLDER}"
+
+# Rows per multi-row INSERT: 80 rows x 12 columns stays under the 999
+# bound-parameter limit of older SQLite builds.
+INSERT_CHUNK = 80
+_INSERT_CHUNK_SQL = (
+    f"INSERT OR IGNORE INTO papers ({_INSERT_COLS}) VALUES "
+    + ", ".join([_ROW_PLACEHOLDER] * INSERT_CHUNK)
+)
+
+
+def _paper_row(paper: dict, fetched_at: str) -> tuple:
+    return (
+        paper["paper_id"],
+        paper["title"],
+        paper.get("authors", ""),
+        paper.get("abstract", ""),
+        paper.get("journal", ""),
+        paper.get("source", ""),
+        paper.get("url", ""),
+        paper.get("doi", ""),
+        paper.get("oa_url", ""),
+        paper.get("pub_date", ""),
+        fetched_at,
+        paper.get("relevant", 0),
     )
 
 
-def update_oa_url(conn: sqlite3.Connection, paper_id: str, oa_url: str):
-    """Backfill OA URL for papers that gained one since initial fetch."""
-    if oa_url:
-        conn.execute(
-            "UPDATE papers SET oa_url = ? WHERE paper_id = ? AND (oa_url IS NULL OR oa_url = '')",
-            (oa_url, paper_id),
-        )
+def insert_papers(conn: sqlite3.Connection, papers: list[dict]) -> int:
+    """Bulk insert papers, skipping known ids. Returns the number of new rows."""
+    fetched_at = datetime.now().isoformat()
+    rows = [_paper_row(p, fetched_at) for p in papers]
+    before = conn.total_changes
+    full = len(rows) - len(rows) % INSERT_CHUNK
+    for i in range(0, full, INSERT_CHUNK):
+        conn.execute(_INSERT_CHUNK_SQL, [v for row in rows[i:i + INSERT_CHUNK] for v in row])
+    conn.executemany(INSERT_SQL, rows[full:])
+    return conn.total_changes - before
+
+
+def update_oa_urls(conn: sqlite3.Connection, papers: list[dict]):
+    """Backfill OA URLs for papers that gained one since initial fetch."""
+    conn.executemany(
+        "UPDATE papers SET oa_url = ? WHERE paper_id = ? AND (oa_url IS NULL OR oa_url = '')",
+        [(p["oa_url"], p["paper_id"]) for p in papers if p.get("oa_url")],
+    )
 
 
 def make_id(title: str, authors: str = "") -> str:
-    """Deterministic ID from normalized title + first author."""
-    raw = re.sub(r"\s+", " ", (title + authors).lower().strip())
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    """
+    Deterministic ID from normalized title + authors. NFKC folding and
+    punctuation stripping make feeds that differ only in unicode dashes,
+    quotes or spacing map to the same paper.
+    """
+    raw = unicodedata.normalize("NFKC", title + authors).lower()
+    raw = "".join(c for c in raw if c.isalnum() or c.isspace())
+    raw = _WS_RE.sub(" ", raw).strip()
+    return hashlib.blake2b(raw.encode(), digest_size=8).hexdigest()
 
 
 # ---------------------------------------------------------------------------
 # Relevance scoring
 # ---------------------------------------------------------------------------
 
-def check_relevance(title: str, abstract: str, keywords: list[str]) -> bool:
-    text = (title + " " + abstract).lower()
-    return any(kw.lower() in text for kw in keywords)
+def build_keyword_re(keywords: list[str]) -> Optional[re.Pattern]:
+    """Compile the keyword list into one alternation so each paper is scanned once."""
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw.lower()) for kw in keywords))
+
+
+def check_relevance(text_lc: str, kw_re: Optional[re.Pattern]) -> bool:
+    """Match an already-lowercased "title abstract" string against the keyword regex."""
+    return kw_re is not None and bool(kw_re.search(text_lc))
 
 
 # ---------------------------------------------------------------------------
 # RSS feed fetcher
 # ---------------------------------------------------------------------------
 
-def fetch_rss(feed_url: str, journal_name: str, keywords: list[str]) -> list[dict]:
-    papers = []
-    log.info("  RSS: %s", journal_name)
+def _rss_struct_time(dt: datetime) -> time.struct_time:
+    # feedparser reports dates in UTC; match it so pub_date is unchanged
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.timetuple()
+
+
+def _rss_author_name(author: str) -> str:
+    """
+    Name part of an RSS <author> value, as feedparser derives it: the e-mail
+    address is removed along with the parentheses or angle brackets around
+    whichever part remains ("jdoe@x.org (Jane Doe)" -> "Jane Doe").
+    """
+    email = _RSS_EMAIL_RE.search(author)
+    if not email:
+        return author
+    name = author.replace(email.group(0), "")
+    name = name.replace("()", "").replace("<>", "").replace("&lt;&gt;", "").strip()
+    if name.startswith("("):
+        name = name[1:]
+    if name.endswith(")"):
+        name = name[:-1]
+    return name.strip()
+
+
+def _fast_rss(body: bytes) -> Optional[list[dict]]:
+    """
+    Parse a plain RSS 2.0 feed with ElementTree, returning entries shaped like
+    feedparser's (title, link, summary, author(s), dates, DOI). Returns None
+    for anything else (RSS 1.0/Atom, malformed XML) so the caller can hand the
+    same bytes to feedparser.
+    """
+    try:
+        root = ET.fromstring(body)
+    except ET.ParseError as e:
+        log.debug("  Fast RSS parse failed: %s", e)
+        return None
+    if root.tag != "rss":
+        return None
+
+    entries = []
+    for item in root.iter("item"):
+        creators = [c.text.strip() for c in item.findall("dc:creator", _RSS_NS) if c.text]
+        entry = {
+            "title": item.findtext("title", ""),
+            "link": item.findtext("link", "").strip(),
+            "summary": item.findtext("description", ""),
+            "authors": [{"name": c} for c in creators],
+            "prism_doi": item.findtext("prism:doi", "", _RSS_NS),
+            "dc_identifier": item.findtext("dc:identifier", "", _RSS_NS),
+        }
+        if creators:
+            entry["author"] = creators[-1]  # feedparser keeps the last creator
+        elif (item.findtext("author") or "").strip():
+            # feedparser keeps the raw value as "author" but lists only the
+            # name (nothing, for a bare address) under "authors"
+            entry["author"] = item.findtext("author").strip()
+            name = _rss_author_name(entry["author"])
+            entry["authors"] = [{"name": name}] if name else [{}]
+        try:
+            if item.findtext("pubDate"):
+                entry["published_parsed"] = _rss_struct_time(
+                    parsedate_to_datetime(item.findtext("pubDate").strip()))
+            elif item.findtext("dc:date", None, _RSS_NS):
+                entry["updated_parsed"] = _rss_struct_time(
+                    datetime.fromisoformat(item.findtext("dc:date", "", _RSS_NS).strip()))
+        except (TypeError, ValueError):
+            pass
+        entries.append(entry)
+    return entries
+
+
+def _feed_entries(feed_url: str, feed_name: str) -> Optional[list]:
+    """
+    Download a feed once and return its entries: read directly when it is
+    plain RSS 2.0, otherwise by feedparser from the same bytes. Returns None,
+    after logging, when the download fails or the feed can't be parsed.
+    """
+    try:
+        resp = SESSION.get(feed_url, timeout=30)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        log.warning("  Feed error for %s: %s", feed_name, e)
+        return None
+    entries = _fast_rss(resp.content)
+    if entries is not None:
+        return entries
     try:
-        feed = feedparser.parse(feed_url)
-        if feed.bozo and not feed.entries:
-            log.warning("  Feed error for %s: %s", journal_name, feed.bozo_exception)
-            return papers
+        # The headers let feedparser pick the charset and resolve relative links
+        feed = feedparser.parse(
+            io.BytesIO(resp.content),
+            response_headers={
+                "content-type": resp.headers.get("Content-Type", ""),
+                "content-location": resp.url,
+            },
+        )
     except Exception as e:
-        log.error("  Failed to parse %s: %s", journal_name, e)
+        log.error("  Failed to parse %s: %s", feed_name, e)
+        return None
+    if feed.bozo and not feed.entries:
+        log.warning("  Feed error for %s: %s", feed_name, feed.bozo_exception)
+        return None
+    return feed.entries
+
+
+def fetch_rss(feed_url: str, journal_name: str, kw_re: Optional[re.Pattern]) -> list[dict]:
+    papers = []
+    log.info("  RSS: %s", journal_name)
+    entries = _feed_entries(feed_url, journal_name)
+    if entries is None:
         return papers
 
-    for entry in feed.entries:
+    for entry in entries:
         title = entry.get("title", "").strip()
         if not title:
             continue
@@ -151,19 +351,19 @@ def fetch_rss(feed_url: str, journal_name: str, keywords: list[str]) -> list[dic
         ) or entry.get("author", "")
 
         abstract = entry.get("summary", "") or entry.get("description", "")
-        abstract = re.sub(r"<[^>]+>", "", abstract).strip()
+        abstract = _HTML_TAG_RE.sub("", abstract).strip()
 
         link = entry.get("link", "")
         doi = entry.get("prism_doi", "") or entry.get("dc_identifier", "")
 
         pub_date = ""
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
-            pub_date = time.strftime("%Y-%m-%d", entry.published_parsed)
-        elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-            pub_date = time.strftime("%Y-%m-%d", entry.updated_parsed)
+        if entry.get("published_parsed"):
+            pub_date = time.strftime("%Y-%m-%d", entry["published_parsed"])
+        elif entry.get("updated_parsed"):
+            pub_date = time.strftime("%Y-%m-%d", entry["updated_parsed"])
 
         paper_id = make_id(title, authors)
-        relevant = check_relevance(title, abstract, keywords)
+        relevant = kw_re is not None and check_relevance((title + " " + abstract).lower(), kw_re)
 
         papers.append({
             "paper_id": paper_id,
@@ -186,11 +386,62 @@ def fetch_rss(feed_url: str, journal_name: str, keywords: list[str]) -> list[dic
 # OpenAlex fetcher (for journals without RSS)
 # ---------------------------------------------------------------------------
 
+def _reconstruct_abstract(inv_index: dict) -> str:
+    """Rebuild abstract text from OpenAlex's {word: [positions]} inverted index."""
+    if not inv_index:
+        return ""
+    pos_word = {pos: word for word, positions in inv_index.items() for pos in positions}
+    return " ".join(pos_word[k] for k in sorted(pos_word))
+
+
+# Work fields _work_to_paper reads; OpenAlex returns only these (`select`)
+OPENALEX_SELECT = (
+    "title,authorships,abstract_inverted_index,doi,primary_location,"
+    "open_access,publication_date"
+)
+
+
+def _work_to_paper(
+    work: dict, journal_name: str, source: str, kw_re: Optional[re.Pattern]
+) -> Optional[dict]:
+    """Convert one OpenAlex work into a paper dict; None if it has no title."""
+    title = (work.get("title") or "").strip()
+    if not title:
+        return None
+
+    authors = ", ".join(
+        a.get("author", {}).get("display_name", "")
+        for a in work.get("authorships", [])[:10]
+    )
+
+    abstract = _reconstruct_abstract(work.get("abstract_inverted_index"))
+
+    doi = work.get("doi", "") or ""
+    paper_url = (work.get("primary_location") or {}).get("landing_page_url", "") or doi
+
+    oa_info = work.get("open_access") or {}
+    relevant = kw_re is not None and check_relevance((title + " " + abstract).lower(), kw_re)
+
+    return {
+        "paper_id": make_id(title, authors),
+        "title": title,
+        "authors": authors,
+        "abstract": abstract[:2000],
+        "journal": journal_name,
+        "source": source,
+        "url": paper_url,
+        "doi": doi,
+        "oa_url": oa_info.get("oa_url", "") or "",
+        "pub_date": work.get("publication_date", ""),
+        "relevant": int(relevant),
+    }
+
+
 def fetch_openalex_journal(
     openalex_id: str,
     journal_name: str,
     email: str,
-    keywords: list[str],
+    kw_re: Optional[re.Pattern],
     lookback_days: int = 60,
 ) -> list[dict]:
     papers = []
@@ -203,10 +454,11 @@ def fetch_openalex_journal(
         "filter": f"primary_location.source.id:{source_short},from_publication_date:{since}",
         "sort": "publication_date:desc",
         "per_page": 50,
+        "select": OPENALEX_SELECT,
         "mailto": email,
     }
     try:
-        resp = requests.get(url, params=params, timeout=30)
+        resp = SESSION.get(url, params=params, timeout=30)
         resp.raise_for_status()
         data = resp.json()
     except Exception as e:
@@ -214,48 +466,9 @@ def fetch_openalex_journal(
         return papers
 
     for work in data.get("results", []):
-        title = work.get("title", "").strip()
-        if not title:
-            continue
-
-        authors = ", ".join(
-            a.get("author", {}).get("display_name", "")
-            for a in work.get("authorships", [])[:10]
-        )
-
-        abstract = ""
-        inv_index = work.get("abstract_inverted_index")
-        if inv_index:
-            word_positions = []
-            for word, positions in inv_index.items():
-                for pos in positions:
-                    word_positions.append((pos, word))
-            word_positions.sort()
-            abstract = " ".join(w for _, w in word_positions)
-
-        doi = work.get("doi", "") or ""
-        paper_url = work.get("primary_location", {}).get("landing_page_url", "") or doi
-        pub_date = work.get("publication_date", "")
-
-        oa_info = work.get("open_access") or {}
-        oa_url = oa_info.get("oa_url", "") or ""
-
-        paper_id = make_id(title, authors)
-        relevant = check_relevance(title, abstract, keywords)
-
-        papers.append({
-            "paper_id": paper_id,
-            "title": title,
-            "authors": authors,
-            "abstract": abstract[:2000],
-            "journal": journal_name,
-            "source": "openalex",
-            "url": paper_url,
-            "doi": doi,
-            "oa_url": oa_url,
-            "pub_date": pub_date,
-            "relevant": int(relevant),
-        })
+        paper = _work_to_paper(work, journal_name, "openalex", kw_re)
+        if paper:
+            papers.append(paper)
 
     log.info("    Found %d entries", len(papers))
     return papers
@@ -265,6 +478,26 @@ def fetch_openalex_journal(
 # OpenAlex broad keyword discovery
 # ---------------------------------------------------------------------------
 
+def _load_oa_cache() -> dict:
+    """Load cached discovery responses, dropping entries older than the TTL."""
+    if not OA_CACHE_PATH.exists():
+        return {}
+    try:
+        cache = json.loads(OA_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        log.debug("  Ignoring unreadable OpenAlex cache: %s", e)
+        return {}
+    now = time.time()
+    return {k: v for k, v in cache.items() if now - v.get("fetched", 0) < OA_CACHE_TTL}
+
+
+def _save_oa_cache(cache: dict):
+    try:
+        OA_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError as e:
+        log.debug("  Could not write OpenAlex cache: %s", e)
+
+
 def fetch_openalex_discovery(
     email: str,
     keywords: list[str],
@@ -276,73 +509,46 @@ def fetch_openalex_discovery(
     since = (datetime.now() - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
 
     batched_keywords = [keywords[i : i + 3] for i in range(0, len(keywords), 3)]
+    cache = _load_oa_cache()
 
     for batch in batched_keywords:
         query = " OR ".join(batch)
-        url = "https://api.openalex.org/works"
-        params = {
-            "search": query,
-            "filter": f"from_publication_date:{since},type:article",
-            "sort": "publication_date:desc",
-            "per_page": min(max_results, 50),
-            "mailto": email,
-        }
-        try:
-            resp = requests.get(url, params=params, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception as e:
-            log.warning("  Discovery search error: %s", e)
-            continue
-
-        for work in data.get("results", []):
-            title = work.get("title", "").strip()
-            if not title:
+        per_page = min(max_results, 50)
+        cache_key = f"{query}|{since}|{per_page}"
+        cached = cache.get(cache_key)
+        if cached:
+            data = cached["data"]
+        else:
+            url = "https://api.openalex.org/works"
+            params = {
+                "search": query,
+                "filter": f"from_publication_date:{since},type:article",
+                "sort": "publication_date:desc",
+                "per_page": per_page,
+                "select": OPENALEX_SELECT,
+                "mailto": email,
+            }
+            try:
+                resp = SESSION.get(url, params=params, timeout=30)
+                resp.raise_for_status()
+                data = resp.json()
+            except Exception as e:
+                log.warning("  Discovery search error: %s", e)
                 continue
+            cache[cache_key] = {"fetched": time.time(), "data": data}
 
+        for work in data.get("results", []):
             source_info = (work.get("primary_location") or {}).get("source") or {}
             journal_name = source_info.get("display_name", "Unknown")
+            paper = _work_to_paper(work, journal_name, "openalex_discovery", None)
+            if paper:
+                paper["relevant"] = 1  # matched the keyword search by construction
+                papers.append(paper)
 
-            authors = ", ".join(
-                a.get("author", {}).get("display_name", "")
-                for a in work.get("authorships", [])[:10]
-            )
-
-            abstract = ""
-            inv_index = work.get("abstract_inverted_index")
-            if inv_index:
-                word_positions = []
-                for word, positions in inv_index.items():
-                    for pos in positions:
-                        word_positions.append((pos, word))
-                word_positions.sort()
-                abstract = " ".join(w for _, w in word_positions)
-
-            doi = work.get("doi", "") or ""
-            paper_url = (work.get("primary_location") or {}).get("landing_page_url", "") or doi
-            pub_date = work.get("publication_date", "")
-
-            oa_info = work.get("open_access") or {}
-            oa_url = oa_info.get("oa_url", "") or ""
-
-            paper_id = make_id(title, authors)
-
-            papers.append({
-                "paper_id": paper_id,
-                "title": title,
-                "authors": authors,
-                "abstract": abstract[:2000],
-                "journal": journal_name,
-                "source": "openalex_discovery",
-                "url": paper_url,
-                "doi": doi,
-                "oa_url": oa_url,
-                "pub_date": pub_date,
-                "relevant": 1,
-            })
-
-        time.sleep(0.2)
+        if not cached:
+            time.sleep(0.2)
 
+    _save_oa_cache(cache)
     log.info("    Found %d discovery results", len(papers))
     return papers
 
@@ -351,34 +557,32 @@ def fetch_openalex_discovery(
 # NBER working papers via RSS
 # ---------------------------------------------------------------------------
 
-def fetch_nber(feeds: list[dict], keywords: list[str]) -> list[dict]:
+def fetch_nber(feeds: list[dict], kw_re: Optional[re.Pattern]) -> list[dict]:
     papers = []
     for feed_info in feeds:
         name = feed_info["name"]
         url = feed_info["url"]
         log.info("  NBER: %s", name)
-        try:
-            feed = feedparser.parse(url)
-        except Exception as e:
-            log.error("  NBER feed error: %s", e)
+        entries = _feed_entries(url, name)
+        if entries is None:
             continue
 
-        for entry in feed.entries:
+        for entry in entries:
             title = entry.get("title", "").strip()
             if not title:
                 continue
 
             authors = entry.get("author", "")
             abstract = entry.get("summary", "") or entry.get("description", "")
-            abstract = re.sub(r"<[^>]+>", "", abstract).strip()
+            abstract = _HTML_TAG_RE.sub("", abstract).strip()
             link = entry.get("link", "")
 
             pub_date = ""
-            if hasattr(entry, "published_parsed") and entry.published_parsed:
-                pub_date = time.strftime("%Y-%m-%d", entry.published_parsed)
+            if entry.get("published_parsed"):
+                pub_date = time.strftime("%Y-%m-%d", entry["published_parsed"])
 
             paper_id = make_id(title, authors)
-            relevant = check_relevance(title, abstract, keywords)
+            relevant = kw_re is not None and check_relevance((title + " " + abstract).lower(), kw_re)
 
             papers.append({
                 "paper_id": paper_id,
@@ -393,7 +597,7 @@ def fetch_nber(feeds: list[dict], keywords: list[str]) -> list[dict]:
                 "relevant": int(relevant),
             })
 
-        log.info("    Found %d entries", len(feed.entries))
+        log.info("    Found %d entries", len(entries))
     return papers
 
 
@@ -401,6 +605,15 @@ def fetch_nber(feeds: list[dict], keywords: list[str]) -> list[dict]:
 # Main
 # ---------------------------------------------------------------------------
 
+def _fetch_journal(j: dict, email: str, kw_re: Optional[re.Pattern]) -> list[dict]:
+    if j["type"] == "rss":
+        return fetch_rss(j["url"], j["name"], kw_re)
+    if j["type"] == "openalex":
+        return fetch_openalex_journal(j["openalex_id"], j["name"], email, kw_re)
+    log.warning("  Unknown type for %s: %s", j["name"], j["type"])
+    return []
+
+
 def run():
     log.info("=" * 60)
     log.info("Literature Tracker — Fetch Run")
@@ -411,6 +624,7 @@ def run():
 
     email = cfg.get("email", "")
     keywords = cfg.get("keywords", [])
+    kw_re = build_keyword_re(keywords)
     journals = cfg.get("journals", [])
     nber_cfg = cfg.get("nber", {})
     discovery_cfg = cfg.get("openalex_discovery", {})
@@ -423,38 +637,27 @@ def run():
     total_fetched = 0
 
     # --- Journal feeds ---
+    # Feeds are independent and network-bound, so fetch them concurrently.
     log.info("Fetching journal publications...")
-    for j in journals:
-        if j["type"] == "rss":
-            papers = fetch_rss(j["url"], j["name"], keywords)
-        elif j["type"] == "openalex":
-            papers = fetch_openalex_journal(
-                j["openalex_id"], j["name"], email, keywords
-            )
-        else:
-            log.warning("  Unknown type for %s: %s", j["name"], j["type"])
-            continue
+    journal_papers = []
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        for papers in ex.map(lambda j: _fetch_journal(j, email, kw_re), journals):
+            journal_papers.extend(papers)
 
-        for p in papers:
-            total_fetched += 1
-            if not paper_exists(conn, p["paper_id"]):
-                insert_paper(conn, p)
-                new_count += 1
-            update_oa_url(conn, p["paper_id"], p.get("oa_url", ""))
-        conn.commit()
-        time.sleep(0.3)
+    # One transaction per source: INSERT OR IGNORE dedups on paper_id
+    with conn:
+        total_fetched += len(journal_papers)
+        new_count += insert_papers(conn, journal_papers)
+        update_oa_urls(conn, journal_papers)
 
     # --- NBER working papers ---
     if nber_cfg.get("enabled"):
         log.info("Fetching NBER working papers...")
-        nber_papers = fetch_nber(nber_cfg.get("feeds", []), keywords)
-        for p in nber_papers:
-            total_fetched += 1
-            if not paper_exists(conn, p["paper_id"]):
-                insert_paper(conn, p)
-                new_count += 1
-            update_oa_url(conn, p["paper_id"], p.get("oa_url", ""))
-        conn.commit()
+        nber_papers = fetch_nber(nber_cfg.get("feeds", []), kw_re)
+        with conn:
+            total_fetched += len(nber_papers)
+            new_count += insert_papers(conn, nber_papers)
+            update_oa_urls(conn, nber_papers)
 
     # --- OpenAlex discovery ---
     if discovery_cfg.get("enabled"):
@@ -465,13 +668,10 @@ def run():
             lookback_days=discovery_cfg.get("lookback_days", 14),
             max_results=discovery_cfg.get("max_results_per_query", 50),
         )
-        for p in disc_papers:
-            total_fetched += 1
-            if not paper_exists(conn, p["paper_id"]):
-                insert_paper(conn, p)
-                new_count += 1
-            update_oa_url(conn, p["paper_id"], p.get("oa_url", ""))
-        conn.commit()
+        with conn:
+            total_fetched += len(disc_papers)
+            new_count += insert_papers(conn, disc_papers)
+            update_oa_urls(conn, disc_papers)
 
     conn.close()
 
@@ -9,6 +9,7 @@ import sqlite3
 import textwrap
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -25,6 +26,13 @@ logging.basicConfig(
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_cfg(mtime: float) -> dict:
+    """Parsed config.yaml; keyed on its mtime so edits are picked up."""
+    with open(CONFIG_PATH) as f:
+        return yaml.safe_load(f)
+
+
 # ---------------------------------------------------------------------------
 # Source grouping for readable output
 # ---------------------------------------------------------------------------
@@ -60,17 +68,49 @@ SOURCE_ORDER = [
 ]
 
 
-def get_papers_since(conn: sqlite3.Connection, since: str) -> list[dict]:
-    cursor = conn.execute(
-        """SELECT title, authors, abstract, journal, source, url, doi,
-                  pub_date, relevant
-           FROM papers
-           WHERE fetched_at >= ?
-           ORDER BY relevant DESC, journal, pub_date DESC""",
-        (since,),
+# Flattened (journal, group) list; a journal's index is its sort ordinal
+_LISTED_JOURNALS = [
+    (j, group_name) for group_name, journal_list in SOURCE_ORDER if journal_list
+    for j in journal_list
+]
+_LISTED_NAMES = tuple(j for j, _ in _LISTED_JOURNALS)
+_UNLISTED = len(_LISTED_JOURNALS)
+_LISTED_PLACEHOLDERS = ", ".join("?" * len(_LISTED_NAMES))
+_GROUP_CASE = (
+    "CASE journal "
+    + " ".join(f"WHEN ? THEN {i}" for i in range(_UNLISTED))
+    + f" ELSE {_UNLISTED} END"
+)
+
+
+def get_papers_since(conn: sqlite3.Connection, since: str) -> sqlite3.Cursor:
+    """
+    Return a lazy cursor over papers fetched since `since`: listed journals
+    in SOURCE_ORDER order (column `g` is the journal's ordinal), then
+    unlisted journals alphabetically. The WHERE clause is a plain range on
+    fetched_at so SQLite can drive the scan from idx_fetched.
+    """
+    return conn.execute(
+        f"""SELECT title, authors, abstract, journal, source, url, doi,
+                   pub_date, relevant, ({_GROUP_CASE}) AS g
+            FROM papers
+            WHERE fetched_at >= ?
+            ORDER BY g, journal, relevant DESC, pub_date DESC""",
+        (*_LISTED_NAMES, since),
+    )
+
+
+def get_discovery_since(conn: sqlite3.Connection, since: str) -> sqlite3.Cursor:
+    """Broad-discovery papers from journals not already shown in a listed group."""
+    return conn.execute(
+        f"""SELECT title, authors, abstract, journal, source, url, doi,
+                   pub_date, relevant
+            FROM papers
+            WHERE source = 'openalex_discovery' AND fetched_at >= ?
+              AND (journal IS NULL OR journal NOT IN ({_LISTED_PLACEHOLDERS}))
+            ORDER BY relevant DESC, journal, pub_date DESC""",
+        (since, *_LISTED_NAMES),
     )
-    cols = [d[0] for d in cursor.description]
-    return [dict(zip(cols, row)) for row in cursor.fetchall()]
 
 
 def truncate(text: str, max_len: int) -> str:
@@ -79,121 +119,104 @@ def truncate(text: str, max_len: int) -> str:
     return text[: max_len - 3].rsplit(" ", 1)[0] + "..."
 
 
+_ABSTRACT_WRAPPER = textwrap.TextWrapper(width=90, initial_indent="  > ", subsequent_indent="  > ")
+
+
 def format_paper(paper: dict, include_abstract: bool, max_abstract: int) -> str:
     star = " **[RELEVANT]**" if paper["relevant"] else ""
     title = paper["title"]
-    authors = paper["authors"] or "Unknown"
     url = paper["url"]
-
-    lines = []
-    if url:
-        lines.append(f"- **[{title}]({url})**{star}")
-    else:
-        lines.append(f"- **{title}**{star}")
-    lines.append(f"  *{authors}*")
-
-    if paper["pub_date"]:
-        lines.append(f"  Published: {paper['pub_date']}")
-
-    if include_abstract and paper["abstract"]:
-        short = truncate(paper["abstract"], max_abstract)
-        wrapped = textwrap.fill(short, width=90, initial_indent="  > ", subsequent_indent="  > ")
-        lines.append(wrapped)
-
-    lines.append("")
-    return "\n".join(lines)
+    head = f"- **[{title}]({url})**{star}" if url else f"- **{title}**{star}"
+    published = f"  Published: {paper['pub_date']}\n" if paper["pub_date"] else ""
+    abstract = (
+        _ABSTRACT_WRAPPER.fill(truncate(paper["abstract"], max_abstract)) + "\n"
+        if include_abstract and paper["abstract"] else ""
+    )
+    return f"{head}\n  *{paper['authors'] or 'Unknown'}*\n{published}{abstract}"
 
 
 def generate_digest(since_date: str = None, lookback_days: int = 7) -> str:
-    with open(CONFIG_PATH) as f:
-        cfg = yaml.safe_load(f)
+    cfg = _load_cfg(CONFIG_PATH.stat().st_mtime)
 
     output_cfg = cfg.get("output", {})
     include_abstract = output_cfg.get("include_abstracts", True)
     max_abstract = output_cfg.get("max_abstract_length", 500)
 
     conn = sqlite3.connect(str(DB_PATH))
+    conn.execute("PRAGMA mmap_size=268435456")  # memory-map reads of the papers table
+    conn.row_factory = sqlite3.Row
 
     if since_date is None:
         since_date = (datetime.now() - timedelta(days=lookback_days)).isoformat()
 
-    papers = get_papers_since(conn, since_date)
-    conn.close()
+    # Listed journals render straight off the cursor; unlisted rows are held
+    # back because Broad Discovery and Other Sources come after them.
+    lines = []
+    unlisted: list[sqlite3.Row] = []
+    total_count = 0
+    relevant_count = 0
+    current_group = current_journal = None
+    for p in get_papers_since(conn, since_date):
+        total_count += 1
+        relevant_count += 1 if p["relevant"] else 0
+        if p["g"] == _UNLISTED:
+            unlisted.append(p)
+            continue
+        journal, group_name = _LISTED_JOURNALS[p["g"]]
+        if group_name != current_group:
+            current_group = group_name
+            lines.append(f"## {group_name}")
+            lines.append("")
+        if journal != current_journal:
+            current_journal = journal
+            lines.append(f"### {journal}")
+            lines.append("")
+        lines.append(format_paper(p, include_abstract, max_abstract))
 
-    if not papers:
+    if not total_count:
+        conn.close()
         return "# Literature Digest\n\nNo new papers found since last check.\n"
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    relevant_count = sum(1 for p in papers if p["relevant"])
-
-    lines = [
-        f"# Literature Digest — {today}",
-        "",
-        f"**{len(papers)} new papers** found ({relevant_count} flagged as relevant to your keywords).",
-        f"Covering: {since_date[:10]} to {today}.",
-        "",
-        "---",
-        "",
-    ]
-
-    # Organize papers by journal into groups
-    journal_to_papers: dict[str, list[dict]] = {}
-    for p in papers:
-        j = p["journal"]
-        journal_to_papers.setdefault(j, []).append(p)
-
-    placed_journals = set()
-
-    for group_name, journal_list in SOURCE_ORDER:
-        if journal_list is None:
-            group_papers = [
-                p for p in papers if p["source"] == "openalex_discovery"
-                and p["journal"] not in placed_journals
-            ]
-        else:
-            group_papers = []
-            for j in journal_list:
-                if j in journal_to_papers:
-                    group_papers.extend(journal_to_papers[j])
-                    placed_journals.add(j)
-
-        if not group_papers:
-            continue
-
-        lines.append(f"## {group_name}")
+    discovery = get_discovery_since(conn, since_date).fetchall()
+    conn.close()
+    if discovery:
+        lines.append("## Broad Discovery")
         lines.append("")
+        for p in discovery:
+            lines.append(format_paper(p, include_abstract, max_abstract))
 
-        if journal_list is None:
-            for p in group_papers:
-                lines.append(format_paper(p, include_abstract, max_abstract))
-        else:
-            current_journal = None
-            for p in group_papers:
-                if p["journal"] != current_journal:
-                    current_journal = p["journal"]
-                    lines.append(f"### {current_journal}")
-                    lines.append("")
-                lines.append(format_paper(p, include_abstract, max_abstract))
-
-    # Any journals not in our predefined groups
-    remaining = {j: ps for j, ps in journal_to_papers.items() if j not in placed_journals}
-    if remaining:
+    # Any journals not in our predefined groups, those with relevant papers
+    # first. Rows arrive grouped by journal with relevant ones leading, so the
+    # first row of each journal tells us; the sort is stable.
+    if unlisted:
         lines.append("## Other Sources")
         lines.append("")
-        for j, ps in remaining.items():
+        by_journal: dict[str, list[sqlite3.Row]] = {}
+        for p in unlisted:
+            by_journal.setdefault(p["journal"], []).append(p)
+        for j, ps in sorted(by_journal.items(), key=lambda kv: not kv[1][0]["relevant"]):
             lines.append(f"### {j}")
             lines.append("")
             for p in ps:
                 lines.append(format_paper(p, include_abstract, max_abstract))
 
-    return "\n".join(lines)
+    today = datetime.now().strftime("%Y-%m-%d")
+    header = [
+        f"# Literature Digest — {today}",
+        "",
+        f"**{total_count} new papers** found ({relevant_count} flagged as relevant to your keywords).",
+        f"Covering: {since_date[:10]} to {today}.",
+        "",
+        "---",
+        "",
+    ]
+    return "\n".join(header + lines)
 
 
 def run(lookback_days: int = 7):
     log.info("Generating digest (last %d days)...", lookback_days)
 
-    with open(CONFIG_PATH) as f:
-        cfg = yaml.safe_load(f)
+    cfg = _load_cfg(CONFIG_PATH.stat().st_mtime)
 
     digest_dir = ROOT / cfg.get("output", {}).get("digest_dir", "output/digests")
     digest_dir.mkdir(parents=True, exist_ok=True)
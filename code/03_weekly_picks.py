@@ -6,11 +6,15 @@ Scores all papers from the past week across multiple dimensions
 and selects the top N for a curated weekly reading list.
 """
 
+import heapq
+import re
 import sqlite3
 import textwrap
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import yaml
 
@@ -25,6 +29,14 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _load_cfg(mtime: float) -> dict:
+    """Parsed config.yaml; keyed on its mtime so edits are picked up."""
+    with open(CONFIG_PATH) as f:
+        return yaml.safe_load(f)
+
+
 # ---------------------------------------------------------------------------
 # Journal tier lookup
 # ---------------------------------------------------------------------------
@@ -58,106 +70,262 @@ FIELD_JOURNALS = {
     "Journal of Political Economy Microeconomics",
 }
 
-ELIGIBLE_SOURCES = TOP5 | TOP_FIELD | FIELD_JOURNALS | {
+ELIGIBLE_SOURCES = frozenset(TOP5 | TOP_FIELD | FIELD_JOURNALS | {
     "NBER Working Paper",
     "Job Market Paper",
+})
+
+
+# Used for any weight missing from weekly_picks.weights in config.yaml
+DEFAULT_WEIGHTS = {
+    "journal_top5": 30,
+    "journal_top_field": 20,
+    "jmp": 17,
+    "journal_field": 15,
+    "nber": 18,
+    "field_match": 25,
+    "structural": 20,
+    "novel_data": 15,
+    "novel_measurement": 15,
+    "keyword_relevant": 10,
 }
 
 
-def _is_eligible(journal: str) -> bool:
-    """Only top-5, top field, field journals, and NBER pass the gate."""
-    return journal in ELIGIBLE_SOURCES or "NBER" in journal
+# Only top-5, top field, field journals, and NBER pass the gate. The exact
+# IN list covers the fetched names; instr() catches other NBER series names
+# and is case-sensitive like Python's `in`, unlike LIKE.
+_ELIGIBLE_PARAMS = tuple(sorted(ELIGIBLE_SOURCES))
+_ELIGIBLE_SQL = (
+    f"(journal IN ({', '.join('?' * len(_ELIGIBLE_PARAMS))}) "
+    "OR instr(journal, 'NBER') > 0)"
+)
+
+
+@lru_cache(maxsize=None)
+def _compile_kws(keywords: tuple[str, ...]) -> tuple[Optional[re.Pattern], tuple[str, ...]]:
+    """
+    Lowercase a keyword list once and build a single alternation regex over
+    it. The regex rejects texts that contain none of the keywords in one
+    scan; only texts it accepts are checked keyword by keyword.
+    """
+    kws = tuple(kw.lower() for kw in keywords)
+    if not kws:
+        return None, kws
+    return re.compile("|".join(map(re.escape, kws))), kws
 
 
-def _keyword_hits(text: str, keywords: list[str]) -> int:
-    text_lower = text.lower()
-    return sum(1 for kw in keywords if kw.lower() in text_lower)
+def _keyword_hits(text_lc: str, keywords: list[str], cap: Optional[int] = None) -> int:
+    """
+    Number of distinct keywords that occur in the already-lowercased text.
+    Counting stops at `cap`, since callers clamp the count anyway.
+    """
+    pattern, kws = _compile_kws(tuple(keywords))
+    if pattern is None or not pattern.search(text_lc):
+        return 0
+    hits = 0
+    for kw in kws:
+        if kw in text_lc:
+            hits += 1
+            if hits == cap:
+                break
+    return hits
 
 
 def score_paper(paper: dict, cfg_picks: dict, weights: dict) -> float:
     """
     Compute a composite score for a paper.
     Higher = more likely to be selected for the weekly reading list.
-    Only called on papers that already passed the eligibility gate.
+    Only called on papers that already passed the eligibility gate and
+    carry `_text` (lowercased title + abstract). `weights` must be complete
+    (DEFAULT_WEIGHTS merged with the configured ones).
     """
     score = 0.0
     journal = paper["journal"]
-    text = (paper["title"] + " " + paper["abstract"]).lower()
+    text = paper["_text"]
 
     # --- Journal tier ---
     if journal in TOP5:
-        score += weights.get("journal_top5", 30)
+        score += weights["journal_top5"]
     elif journal in TOP_FIELD:
-        score += weights.get("journal_top_field", 20)
+        score += weights["journal_top_field"]
     elif journal == "Job Market Paper":
-        score += weights.get("jmp", 17)
+        score += weights["jmp"]
     elif journal in FIELD_JOURNALS:
-        score += weights.get("journal_field", 15)
+        score += weights["journal_field"]
     elif "NBER" in journal:
-        score += weights.get("nber", 18)
+        score += weights["nber"]
 
     # --- Field match (labor, political economy, applied micro) ---
     field_kws = cfg_picks.get("field_keywords", {})
     field_hits = 0
-    for _field_name, kw_list in field_kws.items():
-        field_hits += _keyword_hits(text, kw_list)
+    field_counts = {}
+    for field_name, kw_list in field_kws.items():
+        n = _keyword_hits(text, kw_list, cap=5 - field_hits)
+        field_counts[field_name] = n
+        field_hits += n
+        if field_hits >= 5:
+            break
     if field_hits > 0:
-        score += weights.get("field_match", 25) * min(field_hits, 5) / 3.0
+        score += weights["field_match"] * min(field_hits, 5) / 3.0
 
     # --- Structural paper bonus ---
-    struct_hits = _keyword_hits(text, cfg_picks.get("structural_keywords", []))
+    struct_hits = _keyword_hits(text, cfg_picks.get("structural_keywords", []), cap=4)
     if struct_hits > 0:
-        score += weights.get("structural", 20) * min(struct_hits, 4) / 2.0
+        score += weights["structural"] * min(struct_hits, 4) / 2.0
 
     # --- Novel data bonus ---
-    data_hits = _keyword_hits(text, cfg_picks.get("novel_data_keywords", []))
+    data_hits = _keyword_hits(text, cfg_picks.get("novel_data_keywords", []), cap=4)
     if data_hits > 0:
-        score += weights.get("novel_data", 15) * min(data_hits, 4) / 2.0
+        score += weights["novel_data"] * min(data_hits, 4) / 2.0
 
     # --- Novel measurement / conceptualization bonus ---
-    meas_hits = _keyword_hits(text, cfg_picks.get("novel_measurement_keywords", []))
+    meas_hits = _keyword_hits(text, cfg_picks.get("novel_measurement_keywords", []), cap=3)
     if meas_hits > 0:
-        score += weights.get("novel_measurement", 15) * min(meas_hits, 3) / 2.0
+        score += weights["novel_measurement"] * min(meas_hits, 3) / 2.0
 
     # --- General keyword relevance ---
     if paper.get("relevant"):
-        score += weights.get("keyword_relevant", 10)
+        score += weights["keyword_relevant"]
+
+    # Kept for _make_tags; field categories after the clamp are left out
+    paper["_hits"] = {
+        "field": field_counts,
+        "structural": struct_hits,
+        "novel_data": data_hits,
+        "novel_measurement": meas_hits,
+    }
 
     return round(score, 2)
 
 
-def get_recent_papers(conn: sqlite3.Connection, days: int) -> list[dict]:
+def count_recent_papers(conn: sqlite3.Connection, days: int) -> int:
     since = (datetime.now() - timedelta(days=days)).isoformat()
-    cursor = conn.execute(
-        """SELECT paper_id, title, authors, abstract, journal, source,
-                  url, doi, oa_url, pub_date, relevant
-           FROM papers
-           WHERE fetched_at >= ?""",
-        (since,),
-    )
-    cols = [d[0] for d in cursor.description]
-    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+    return conn.execute(
+        "SELECT COUNT(*) FROM papers WHERE fetched_at >= ?", (since,)
+    ).fetchone()[0]
 
 
 def get_unpicked_papers(conn: sqlite3.Connection) -> list[dict]:
-    """Return all papers that have never been selected for a reading list."""
+    """
+    Return all eligible papers that have never been selected for a reading
+    list. Expects conn.row_factory = sqlite3.Row; rows become dicts because
+    scoring annotates them.
+    """
     cursor = conn.execute(
-        """SELECT paper_id, title, authors, abstract, journal, source,
+        f"""SELECT paper_id, title, authors, abstract, journal, source,
                   url, doi, oa_url, pub_date, relevant
            FROM papers
-           WHERE picked = 0""",
+           WHERE picked = 0 AND {_ELIGIBLE_SQL}
+           ORDER BY rowid""",
+        _ELIGIBLE_PARAMS,
+    )
+    return [dict(row) for row in cursor]
+
+
+def clear_ineligible(conn: sqlite3.Connection) -> int:
+    """Mark unpicked non-target-journal papers as picked (caller commits); returns the count."""
+    cur = conn.execute(
+        f"UPDATE papers SET picked = 1 WHERE picked = 0 AND NOT {_ELIGIBLE_SQL}",
+        _ELIGIBLE_PARAMS,
     )
-    cols = [d[0] for d in cursor.description]
-    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+    return cur.rowcount
 
 
 def mark_as_picked(conn: sqlite3.Connection, paper_ids: list):
-    """Mark papers as picked so they won't be selected again."""
+    """Mark papers as picked so they won't be selected again. The caller commits."""
     conn.executemany(
         "UPDATE papers SET picked = 1 WHERE paper_id = ?",
         [(pid,) for pid in paper_ids],
     )
-    conn.commit()
+
+
+def score_all(
+    papers: list[dict], picks_cfg: dict, weights: dict, min_score: float
+) -> tuple[list[dict], list[str]]:
+    """
+    Annotate each paper with `_text`, `_score` and `_hits`, and split the
+    pool on the threshold in one pass. Returns (papers at or above
+    min_score, ids of the papers below it).
+    """
+    above, below_ids = [], []
+    for p in papers:
+        # Lowercased once here; score_paper and _make_tags both match against it
+        p["_text"] = (p["title"] + " " + (p["abstract"] or "")).lower()
+        p["_score"] = score_paper(p, picks_cfg, weights)
+        if p["_score"] >= min_score:
+            above.append(p)
+        else:
+            below_ids.append(p["paper_id"])
+    return above, below_ids
+
+
+def dedup_by_title(papers: list[dict]) -> list[dict]:
+    """
+    Keep only the highest-scoring entry per unique title (the earliest on
+    ties, as a stable sort would), preserving input order.
+    """
+    best: dict[str, dict] = {}
+    for p in papers:
+        title_norm = p["title"].strip().lower()
+        kept = best.setdefault(title_norm, p)
+        if p["_score"] > kept["_score"]:
+            best[title_norm] = p
+    kept_ids = {id(p) for p in best.values()}
+    return [p for p in papers if id(p) in kept_ids]
+
+
+def format_reading_list(
+    selected: list[dict],
+    runners: list[dict],
+    picks_cfg: dict,
+    max_abstract: int,
+    today: datetime,
+    pool_size: int,
+    new_count: int,
+    unpicked_remaining: int,
+) -> str:
+    """Render the weekly reading list markdown; no I/O."""
+    num_papers = picks_cfg.get("num_papers", 7)
+    week_start = today + timedelta(days=1)
+    week_end = week_start + timedelta(days=6)
+    week_label = f"{week_start.strftime('%b %d')} – {week_end.strftime('%b %d, %Y')}"
+
+    backlog_note = ""
+    if unpicked_remaining > 0:
+        backlog_note = (
+            f" {unpicked_remaining} papers remain in the backlog for future weeks."
+        )
+
+    lines = [
+        f"# Weekly Reading List",
+        f"## {week_label}",
+        "",
+        f"*Curated on {today.strftime('%A, %B %d, %Y')} — {num_papers} papers selected "
+        f"from {pool_size} unpicked candidates "
+        f"({new_count} new this week).{backlog_note}*",
+        "",
+        "Selection criteria: labor economics, political economy, applied micro, "
+        "structural models, novel data, novel measurement/conceptualization.",
+        "",
+        "---",
+        "",
+    ]
+
+    lines.extend(
+        _format_paper_block(p, i, picks_cfg, max_abstract)
+        for i, p in enumerate(selected, 1)
+    )
+
+    # Runner-up list (next 7)
+    if runners:
+        lines.append("## Also worth a look")
+        lines.append("")
+        for p in runners:
+            url_bit = f" — [link]({p['url']})" if p["url"] else ""
+            lines.append(f"- **{p['title']}** (*{p['journal']}*){url_bit}")
+        lines.append("")
+
+    return "\n".join(lines)
 
 
 def pick_weekly_reading(lookback_days: int = 7) -> tuple[str, str, list[dict]]:
@@ -170,155 +338,76 @@ def pick_weekly_reading(lookback_days: int = 7) -> tuple[str, str, list[dict]]:
 
     Returns (markdown_string, output_file_path, selected_paper_dicts).
     """
-    with open(CONFIG_PATH) as f:
-        cfg = yaml.safe_load(f)
+    cfg = _load_cfg(CONFIG_PATH.stat().st_mtime)
 
     picks_cfg = cfg.get("weekly_picks", {})
-    weights = picks_cfg.get("weights", {})
+    # Defaults are merged once here so score_paper does plain lookups per paper
+    weights = {**DEFAULT_WEIGHTS, **picks_cfg.get("weights", {})}
     num_papers = picks_cfg.get("num_papers", 7)
     min_score = picks_cfg.get("min_score", 20)
     output_cfg = cfg.get("output", {})
     max_abstract = output_cfg.get("max_abstract_length", 500)
 
     conn = sqlite3.connect(str(DB_PATH))
+    conn.execute("PRAGMA synchronous=NORMAL")  # the file is already in WAL mode (init_db)
+    conn.row_factory = sqlite3.Row
+
+    # Hard gate: only top-5, top field, field journals, and NBER
+    cleared = clear_ineligible(conn)
+    if cleared:
+        log.info("Auto-cleared %d papers from non-target journals.", cleared)
 
     # Use ALL unpicked papers as the candidate pool
     papers = get_unpicked_papers(conn)
 
     if not papers:
-        log.warning("No unpicked papers remaining in the database.")
+        conn.commit()
         conn.close()
-        return "# Weekly Reading List\n\nNo new papers this week.\n", "", []
-
-    new_this_week = get_recent_papers(conn, lookback_days)
-    new_count = len(new_this_week)
-
-    # Hard gate: only top-5, top field, field journals, and NBER
-    ineligible = [p for p in papers if not _is_eligible(p["journal"])]
-    if ineligible:
-        mark_as_picked(conn, [p["paper_id"] for p in ineligible])
-        log.info(
-            "Auto-cleared %d papers from non-target journals.", len(ineligible),
-        )
-    papers = [p for p in papers if _is_eligible(p["journal"])]
-
-    if not papers:
+        if not cleared:
+            log.warning("No unpicked papers remaining in the database.")
+            return "# Weekly Reading List\n\nNo new papers this week.\n", "", []
         log.warning("No eligible papers remaining.")
-        conn.close()
         return "# Weekly Reading List\n\nNo eligible papers this week.\n", "", []
 
-    for p in papers:
-        p["_score"] = score_paper(p, picks_cfg, weights)
+    new_count = count_recent_papers(conn, lookback_days)
 
-    papers.sort(key=lambda p: p["_score"], reverse=True)
-
-    # Deduplicate: keep only the highest-scoring entry per unique title
-    seen_titles = set()
-    unique = []
-    for p in papers:
-        title_norm = p["title"].strip().lower()
-        if title_norm not in seen_titles:
-            seen_titles.add(title_norm)
-            unique.append(p)
+    above, below_ids = score_all(papers, picks_cfg, weights, min_score)
 
     # Auto-clear papers below relevance threshold
-    below = [p for p in unique if p["_score"] < min_score]
-    if below:
-        mark_as_picked(conn, [p["paper_id"] for p in below])
+    if below_ids:
+        mark_as_picked(conn, below_ids)
         log.info(
             "Auto-cleared %d papers below score threshold (%.0f).",
-            len(below), min_score,
+            len(below_ids), min_score,
         )
 
-    eligible = [p for p in unique if p["_score"] >= min_score]
-    if not eligible:
+    if not above:
         log.warning("No papers above score threshold (%.0f).", min_score)
+        conn.commit()
         conn.close()
         return "# Weekly Reading List\n\nNo papers above the relevance threshold this week.\n", "", []
 
-    selected = eligible[:num_papers]
+    eligible = dedup_by_title(above)
+
+    # Only the picks and the runner-up list are ever shown, so select those
+    # with a bounded heap instead of sorting the whole pool
+    top = heapq.nlargest(num_papers + 7, eligible, key=lambda p: p["_score"])
+    selected = top[:num_papers]
 
     # Mark selected papers so they won't be picked again
     mark_as_picked(conn, [p["paper_id"] for p in selected])
     unpicked_remaining = conn.execute(
         "SELECT COUNT(*) FROM papers WHERE picked = 0"
     ).fetchone()[0]
+    conn.commit()  # ineligible, below-threshold and selected updates land together
     conn.close()
 
-    # --- Format the reading list ---
     today = datetime.now()
-    week_start = today + timedelta(days=1)
-    week_end = week_start + timedelta(days=6)
-    week_label = f"{week_start.strftime('%b %d')} – {week_end.strftime('%b %d, %Y')}"
-
-    backlog_note = ""
-    if unpicked_remaining > 0:
-        backlog_note = (
-            f" {unpicked_remaining} papers remain in the backlog for future weeks."
-        )
-
-    lines = [
-        f"# Weekly Reading List",
-        f"## {week_label}",
-        "",
-        f"*Curated on {today.strftime('%A, %B %d, %Y')} — {num_papers} papers selected "
-        f"from {len(papers)} unpicked candidates "
-        f"({new_count} new this week).{backlog_note}*",
-        "",
-        "Selection criteria: labor economics, political economy, applied micro, "
-        "structural models, novel data, novel measurement/conceptualization.",
-        "",
-        "---",
-        "",
-    ]
-
-    for i, p in enumerate(selected, 1):
-        title = p["title"]
-        authors = p["authors"] or "Unknown"
-        journal = p["journal"]
-        url = p["url"]
-        abstract = p["abstract"] or ""
-        score = p["_score"]
-        pub_date = p["pub_date"]
-
-        tags = _make_tags(p, picks_cfg)
-        tag_str = "  " + " ".join(f"`{t}`" for t in tags) if tags else ""
-
-        lines.append(f"### {i}. {title}")
-        lines.append("")
-
-        if url:
-            lines.append(f"**[Open paper]({url})**")
-        lines.append(f"*{authors}*")
-        lines.append(f"*{journal}*" + (f" — {pub_date}" if pub_date else ""))
-        if tag_str:
-            lines.append(tag_str)
-        lines.append("")
-
-        if abstract:
-            short = abstract[:max_abstract]
-            if len(abstract) > max_abstract:
-                short = short.rsplit(" ", 1)[0] + "..."
-            wrapped = textwrap.fill(
-                short, width=90, initial_indent="> ", subsequent_indent="> "
-            )
-            lines.append(wrapped)
-            lines.append("")
-
-        lines.append("---")
-        lines.append("")
-
-    # Runner-up list (next 7)
-    runners = eligible[num_papers : num_papers + 7]
-    if runners:
-        lines.append("## Also worth a look")
-        lines.append("")
-        for p in runners:
-            url_bit = f" — [link]({p['url']})" if p["url"] else ""
-            lines.append(f"- **{p['title']}** (*{p['journal']}*){url_bit}")
-        lines.append("")
-
-    md = "\n".join(lines)
+    md = format_reading_list(
+        selected, top[num_papers:], picks_cfg, max_abstract, today,
+        pool_size=len(papers), new_count=new_count,
+        unpicked_remaining=unpicked_remaining,
+    )
 
     # Write to file
     picks_dir = ROOT / output_cfg.get("weekly_picks_dir", "output/weekly_reading")
@@ -331,21 +420,56 @@ def pick_weekly_reading(lookback_days: int = 7) -> tuple[str, str, list[dict]]:
     return md, str(out_path), selected
 
 
+_ABSTRACT_WRAPPER = textwrap.TextWrapper(width=90, initial_indent="> ", subsequent_indent="> ")
+
+
+def _format_paper_block(paper: dict, rank: int, picks_cfg: dict, max_abstract: int) -> str:
+    """One selected paper's section of the reading list, ending in a rule."""
+    url = paper["url"]
+    pub_date = paper["pub_date"]
+    abstract = paper["abstract"] or ""
+    tags = _make_tags(paper, picks_cfg)
+
+    block = [f"### {rank}. {paper['title']}", ""]
+    if url:
+        block.append(f"**[Open paper]({url})**")
+    block.append(f"*{paper['authors'] or 'Unknown'}*")
+    block.append(f"*{paper['journal']}*" + (f" — {pub_date}" if pub_date else ""))
+    if tags:
+        block.append("  " + " ".join(f"`{t}`" for t in tags))
+    block.append("")
+
+    if abstract:
+        short = abstract[:max_abstract]
+        if len(abstract) > max_abstract:
+            short = short.rsplit(" ", 1)[0] + "..."
+        block.append(_ABSTRACT_WRAPPER.fill(short))
+        block.append("")
+
+    block.append("---")
+    block.append("")
+    return "\n".join(block)
+
+
 def _make_tags(paper: dict, picks_cfg: dict) -> list[str]:
-    text = (paper["title"] + " " + paper["abstract"]).lower()
+    """Tags for a scored paper, read from the hit counts score_paper left."""
+    hits = paper["_hits"]
     tags = []
 
     field_kws = picks_cfg.get("field_keywords", {})
     for field_name, kw_list in field_kws.items():
-        if _keyword_hits(text, kw_list) > 0:
+        n = hits["field"].get(field_name)
+        if n is None:  # scoring stopped before this category
+            n = _keyword_hits(paper["_text"], kw_list, cap=1)
+        if n:
             pretty = field_name.replace("_", " ").title()
             tags.append(pretty)
 
-    if _keyword_hits(text, picks_cfg.get("structural_keywords", [])) > 0:
+    if hits["structural"]:
         tags.append("Structural")
-    if _keyword_hits(text, picks_cfg.get("novel_data_keywords", [])) > 0:
+    if hits["novel_data"]:
         tags.append("Novel Data")
-    if _keyword_hits(text, picks_cfg.get("novel_measurement_keywords", [])) > 0:
+    if hits["novel_measurement"]:
         tags.append("Novel Measurement")
 
     journal = paper["journal"]
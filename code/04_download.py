@@ -2,27 +2,40 @@
 """
 Literature Tracker — Paper Downloader
 Downloads PDFs for the weekly reading list using a multi-source
-fallback chain:
+fallback chain (order configurable via download.sources):
   1. OpenAlex OA URL (already in DB)
   2. Unpaywall API (free, best legal OA coverage)
   3. Semantic Scholar API (supplementary OA source)
-  4. NBER direct PDF link (for NBER working papers)
+  4. NBER direct PDF link (tried first for NBER working papers)
 
 Papers without any discoverable OA version are logged for manual download.
 """
 
+import hashlib
+import json
 import logging
+import os
+import random
 import re
+import threading
 import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 
 import requests
 import yaml
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT / "config.yaml"
+API_CACHE_DIR = ROOT / "data" / "cache"  # per-lookup Unpaywall / Semantic Scholar JSON
+API_CACHE_TTL = 30 * 24 * 3600  # seconds; OA status changes slowly
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,6 +44,14 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _load_cfg(mtime: float) -> dict:
+    """Parsed config.yaml; keyed on its mtime so edits are picked up."""
+    with open(CONFIG_PATH) as f:
+        return yaml.safe_load(f)
+
+
 # Mimic a real browser to avoid 403s from publisher CDNs
 HEADERS = {
     "User-Agent": (
@@ -39,106 +60,371 @@ HEADERS = {
         "Chrome/120.0.0.0 Safari/537.36"
     ),
     "Accept": "application/pdf,*/*",
+    # requests' defaults, pinned: JSON lookups come back compressed and
+    # connections stay open for the next request to the same host
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+# Max papers downloaded in parallel; each still walks its own fallback chain
+DOWNLOAD_WORKERS = 4
+
+# One pooled session for the whole fallback chain, so repeated hits on the
+# same hosts (Unpaywall, Semantic Scholar, nber.org) reuse connections. Each
+# host's pool must exceed the worker count or urllib3 drops the extras.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=32, pool_maxsize=2 * DOWNLOAD_WORKERS, max_retries=0
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+# Default size cap for one PDF; download.max_pdf_mb in config.yaml overrides it
+MAX_PDF_BYTES = 50 * 1024 * 1024
+
+# When an OA landing page names no PDF link, also guess common PDF URL suffixes
+OA_SUFFIX_FALLBACK = True
+
+# How much of an HTML landing page to read while looking for its PDF link
+LANDING_PAGE_MAX_BYTES = 2 * 1024 * 1024
+
+# Statuses worth another attempt; anything else is a definitive answer
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Requests per second allowed to each host; unlisted hosts get DEFAULT_HOST_RATE
+HOST_RATES = {
+    "api.semanticscholar.org": 1.0,
+    "api.unpaywall.org": 5.0,
 }
+DEFAULT_HOST_RATE = 2.0
+
+
+class HostRateLimiter:
+    """
+    Token bucket per host. Workers hitting different hosts never wait on
+    each other; requests to the same host are spaced to its rate.
+    """
+
+    def __init__(self, rates: dict[str, float], default_rate: float, burst: float = 1.0):
+        self.rates = rates
+        self.default_rate = default_rate
+        self.burst = burst
+        self._buckets: dict[str, tuple[float, float]] = {}  # host -> (tokens, last refill)
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str):
+        rate = self.rates.get(host, self.default_rate)
+        with self._lock:
+            now = time.monotonic()
+            tokens, last = self._buckets.get(host, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - last) * rate) - 1
+            self._buckets[host] = (tokens, now)
+        # A negative balance is this caller's place in the queue for the host
+        if tokens < 0:
+            time.sleep(-tokens / rate)
+
+
+LIMITER = HostRateLimiter(HOST_RATES, DEFAULT_HOST_RATE)
+
+
+def _get_with_retry(
+    url: str,
+    *,
+    timeout: int,
+    method: str = "GET",
+    max_retries: int = 3,
+    base: float = 1.0,
+    cap: float = 30.0,
+    **kwargs,
+) -> requests.Response:
+    """
+    SESSION request (GET unless `method` says otherwise) with exponential
+    backoff and jitter on timeouts, connection errors, 429 and 5xx. Honors
+    a numeric Retry-After header. After the last retry the final response
+    is returned (or the error re-raised).
+    """
+    for attempt in range(max_retries + 1):
+        LIMITER.acquire(urlparse(url).netloc)
+        try:
+            resp = SESSION.request(method, url, timeout=timeout, **kwargs)
+        except (requests.Timeout, requests.ConnectionError):
+            if attempt == max_retries:
+                raise
+            delay = min(cap, base * 2 ** attempt)
+        else:
+            if resp.status_code not in RETRY_STATUSES or attempt == max_retries:
+                return resp
+            retry_after = resp.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = min(cap, float(retry_after))
+            else:
+                delay = min(cap, base * 2 ** attempt)
+            # A streamed body is still unread; release its pooled connection
+            resp.close()
+        time.sleep(delay * (1 + random.uniform(0, 0.5)))
+
+
+_RE_UNSAFE = re.compile(r"[^a-z0-9\s-]")
+_RE_SPACES = re.compile(r"\s+")
+_RE_NBER_PAPER = re.compile(r"/papers/(w\d+)")
 
 
 def _sanitize_filename(title: str, max_len: int = 80) -> str:
     """Turn a paper title into a safe, readable filename."""
-    s = title.lower().strip()
-    s = re.sub(r"[^a-z0-9\s-]", "", s)
-    s = re.sub(r"\s+", "_", s).strip("_")
+    # Surrounding whitespace becomes a single "_" that strip("_") removes
+    s = _RE_SPACES.sub("_", _RE_UNSAFE.sub("", title.lower())).strip("_")
     return s[:max_len]
 
 
 def _is_pdf(content: bytes) -> bool:
-    return content[:5] == b"%PDF-"
+    return content.startswith(b"%PDF-")
+
+
+def _looks_like_html(head: bytes) -> bool:
+    return b"<html" in head[:500].lower()
+
+
+def _save_pdf(
+    resp: requests.Response, dest: Path, max_bytes: int, html_max_bytes: int = 0
+) -> tuple[bool, bytes]:
+    """
+    Stream a 200 response to dest. Returns (True, b"") when it starts with
+    the PDF magic and fits in max_bytes. Otherwise returns (False, first
+    chunk) and stops reading, so a non-PDF costs one chunk rather than the
+    whole body; an HTML body is instead read up to html_max_bytes so the
+    caller can parse it. Chunks go to a .part file that only replaces dest
+    once complete, so memory stays at one chunk and no truncated PDF is left.
+    """
+    chunks = resp.iter_content(65536)
+    head = b""
+    for chunk in chunks:
+        head += chunk
+        if len(head) >= 5:
+            break
+    if not _is_pdf(head):
+        if len(head) < html_max_bytes and _looks_like_html(head):
+            for chunk in chunks:
+                head += chunk
+                if len(head) >= html_max_bytes:
+                    break
+        return False, head
+    part = dest.with_name(dest.name + ".part")
+    try:
+        with open(part, "wb") as f:
+            f.write(head)
+            size = len(head)
+            for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    log.warning("    PDF over %d MB, skipped: %s", max_bytes // (1024 * 1024), resp.url)
+                    break
+                f.write(chunk)
+            else:
+                part.replace(dest)
+                return True, b""
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    part.unlink(missing_ok=True)
+    return False, b""
+
+
+def _get_pdf(url: str, dest: Path, timeout: int, max_bytes: int) -> bool:
+    """GET url and save it to dest if it is a PDF within max_bytes."""
+    resp = _get_with_retry(url, timeout=timeout, allow_redirects=True, stream=True)
+    with closing(resp):
+        if resp.status_code != 200:
+            return False
+        return _save_pdf(resp, dest, max_bytes)[0]
+
+
+def _is_html_page(url: str, timeout: int) -> bool:
+    """
+    HEAD probe: True only when the server positively reports an HTML page.
+    Anything inconclusive (errors, 405, missing or generic content type)
+    returns False so the caller still tries a GET.
+    """
+    LIMITER.acquire(urlparse(url).netloc)
+    try:
+        resp = SESSION.head(url, timeout=timeout, allow_redirects=True)
+    except requests.RequestException:
+        return False
+    content_type = resp.headers.get("Content-Type", "").lower()
+    return resp.status_code == 200 and content_type.startswith("text/html")
+
+
+# Lookups currently being fetched, keyed by (kind, key); workers asking for
+# the same DOI wait on the first one's result instead of calling the API again
+_INFLIGHT: dict[tuple[str, str], Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _get_json_cached(
+    kind: str, key: str, url: str, params: dict, timeout: int
+) -> Optional[dict]:
+    """
+    GET a JSON metadata lookup, reusing a cached copy younger than
+    API_CACHE_TTL. Only successful (200) responses are cached, one file per
+    key under data/cache/<kind>/, so re-runs skip lookups already answered.
+    Concurrent calls for the same key share a single request.
+    """
+    with _INFLIGHT_LOCK:
+        fut = _INFLIGHT.get((kind, key))
+        owner = fut is None
+        if owner:
+            fut = _INFLIGHT[(kind, key)] = Future()
+    if not owner:
+        return fut.result()
+
+    try:
+        data = _lookup_json(kind, key, url, params, timeout)
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    else:
+        fut.set_result(data)
+        return data
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[(kind, key)]
+
+
+def _api_cache_path(kind: str, key: str) -> Path:
+    return API_CACHE_DIR / kind / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def _cache_json(kind: str, path: Path, data: dict):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data), encoding="utf-8")
+    except OSError as e:
+        log.debug("    Could not cache %s lookup: %s", kind, e)
+
+
+def _lookup_json(
+    kind: str, key: str, url: str, params: dict, timeout: int
+) -> Optional[dict]:
+    path = _api_cache_path(kind, key)
+    try:
+        if time.time() - path.stat().st_mtime < API_CACHE_TTL:
+            return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass
+
+    resp = _get_with_retry(url, params=params, timeout=timeout)
+    if resp.status_code != 200:
+        return None
+    data = resp.json()
+    _cache_json(kind, path, data)
+    return data
+
+
+def _landing_page_pdf_url(html: bytes, page_url: str) -> Optional[str]:
+    """
+    PDF link advertised by an HTML landing page: the citation_pdf_url meta
+    tag (Highwire/Google Scholar convention) or else the first link ending
+    in .pdf, resolved against page_url.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    meta = soup.find("meta", attrs={"name": "citation_pdf_url"})
+    if meta and meta.get("content"):
+        return urljoin(page_url, meta["content"])
+    link = soup.select_one('a[href$=".pdf"]')
+    if link:
+        return urljoin(page_url, link["href"])
+    return None
 
 
 def _clean_doi(doi: str) -> str:
     """Extract bare DOI from a full URL or bare string."""
-    if not doi:
-        return ""
-    doi = doi.strip()
-    if doi.startswith("https://doi.org/"):
-        doi = doi[len("https://doi.org/"):]
-    elif doi.startswith("http://doi.org/"):
-        doi = doi[len("http://doi.org/"):]
-    return doi
+    return (doi or "").strip().removeprefix("https://doi.org/").removeprefix("http://doi.org/")
 
 
 # ---------------------------------------------------------------------------
 # Source 1: OpenAlex OA URL (already in DB)
 # ---------------------------------------------------------------------------
 
-def _try_openalex_oa(oa_url: str, timeout: int) -> Optional[bytes]:
+def _try_openalex_oa(
+    oa_url: str, dest: Path, timeout: int, max_bytes: int = MAX_PDF_BYTES
+) -> bool:
     if not oa_url:
-        return None
+        return False
     log.info("    [OpenAlex OA] Trying %s", oa_url[:80])
     try:
-        resp = requests.get(oa_url, headers=HEADERS, timeout=timeout, allow_redirects=True)
-        if resp.status_code == 200 and _is_pdf(resp.content):
-            return resp.content
-        # Some OA URLs point to HTML landing pages; try appending .pdf or
-        # following the "pdf" link heuristic
-        if resp.status_code == 200 and b"<html" in resp.content[:500].lower():
-            # Try common PDF redirect patterns
-            for suffix in [".pdf", "/pdf", "/export/pdf"]:
-                pdf_url = oa_url.rstrip("/") + suffix
-                resp2 = requests.get(pdf_url, headers=HEADERS, timeout=timeout, allow_redirects=True)
-                if resp2.status_code == 200 and _is_pdf(resp2.content):
-                    return resp2.content
+        resp = _get_with_retry(oa_url, timeout=timeout, allow_redirects=True, stream=True)
+        with closing(resp):
+            if resp.status_code != 200:
+                return False
+            saved, head = _save_pdf(resp, dest, max_bytes, LANDING_PAGE_MAX_BYTES)
+        if saved:
+            return True
+        # Some OA URLs point to HTML landing pages; follow the PDF link the
+        # page advertises. Inline scripts can push the citation_pdf_url meta
+        # tag and body links well past the first chunk, hence the longer read.
+        if _looks_like_html(head):
+            pdf_url = _landing_page_pdf_url(head, resp.url or oa_url)
+            if pdf_url:
+                log.info("    [OpenAlex OA] Landing page links %s", pdf_url[:80])
+                return _get_pdf(pdf_url, dest, timeout, max_bytes)
+            if OA_SUFFIX_FALLBACK:
+                # Try common PDF redirect patterns
+                for suffix in [".pdf", "/pdf", "/export/pdf"]:
+                    if _get_pdf(oa_url.rstrip("/") + suffix, dest, timeout, max_bytes):
+                        return True
     except Exception as e:
         log.debug("    [OpenAlex OA] Failed: %s", e)
-    return None
+    return False
 
 
 # ---------------------------------------------------------------------------
 # Source 2: Unpaywall API
 # ---------------------------------------------------------------------------
 
-def _try_unpaywall(doi: str, email: str, timeout: int) -> Optional[bytes]:
+def _try_unpaywall(
+    doi: str, email: str, dest: Path, timeout: int, max_bytes: int = MAX_PDF_BYTES
+) -> bool:
     bare_doi = _clean_doi(doi)
     if not bare_doi:
-        return None
+        return False
     api_url = f"https://api.unpaywall.org/v2/{bare_doi}"
     log.info("    [Unpaywall] Looking up DOI %s", bare_doi)
     try:
-        resp = requests.get(api_url, params={"email": email}, timeout=timeout)
-        if resp.status_code != 200:
-            return None
-        data = resp.json()
-
-        # Try best OA location first, then all locations
-        candidates = []
-        best = data.get("best_oa_location") or {}
-        if best.get("url_for_pdf"):
-            candidates.append(best["url_for_pdf"])
-        if best.get("url"):
-            candidates.append(best["url"])
-        for loc in data.get("oa_locations", []):
-            if loc.get("url_for_pdf"):
-                candidates.append(loc["url_for_pdf"])
-            if loc.get("url"):
-                candidates.append(loc["url"])
-
-        for pdf_url in dict.fromkeys(candidates):  # dedupe preserving order
+        data = _get_json_cached("unpaywall", bare_doi, api_url, {"email": email}, timeout)
+        if data is None:
+            return False
+
+        # Try best OA location first, then all locations. Each URL maps to
+        # whether Unpaywall listed it as a direct PDF link.
+        candidates: dict[str, bool] = {}
+        for loc in [data.get("best_oa_location") or {}] + data.get("oa_locations", []):
+            for key, is_pdf_link in (("url_for_pdf", True), ("url", False)):
+                if loc.get(key):
+                    candidates[loc[key]] = candidates.get(loc[key], False) or is_pdf_link
+
+        for pdf_url, is_pdf_link in candidates.items():
+            if not is_pdf_link and _is_html_page(pdf_url, timeout):
+                log.info("    [Unpaywall] Skipping landing page %s", pdf_url[:80])
+                continue
             log.info("    [Unpaywall] Trying %s", pdf_url[:80])
             try:
-                resp2 = requests.get(pdf_url, headers=HEADERS, timeout=timeout, allow_redirects=True)
-                if resp2.status_code == 200 and _is_pdf(resp2.content):
-                    return resp2.content
+                if _get_pdf(pdf_url, dest, timeout, max_bytes):
+                    return True
             except Exception:
                 continue
     except Exception as e:
         log.debug("    [Unpaywall] Failed: %s", e)
-    return None
+    return False
 
 
 # ---------------------------------------------------------------------------
 # Source 3: Semantic Scholar API
 # ---------------------------------------------------------------------------
 
-def _try_semantic_scholar(doi: str, title: str, timeout: int) -> Optional[bytes]:
+def _try_semantic_scholar(
+    doi: str, title: str, dest: Path, timeout: int, max_bytes: int = MAX_PDF_BYTES
+) -> bool:
     # Try by DOI first, then by title search
     bare_doi = _clean_doi(doi)
     pdf_url = None
@@ -147,11 +433,10 @@ def _try_semantic_scholar(doi: str, title: str, timeout: int) -> Optional[bytes]
         log.info("    [SemanticScholar] Looking up DOI %s", bare_doi)
         api_url = f"https://api.semanticscholar.org/graph/v1/paper/DOI:{bare_doi}"
         try:
-            resp = requests.get(
-                api_url, params={"fields": "openAccessPdf"}, timeout=timeout
+            data = _get_json_cached(
+                "s2", f"doi:{bare_doi}", api_url, {"fields": "openAccessPdf"}, timeout
             )
-            if resp.status_code == 200:
-                data = resp.json()
+            if data is not None:
                 oa = data.get("openAccessPdf") or {}
                 pdf_url = oa.get("url")
         except Exception as e:
@@ -160,13 +445,15 @@ def _try_semantic_scholar(doi: str, title: str, timeout: int) -> Optional[bytes]
     if not pdf_url and title:
         log.info("    [SemanticScholar] Searching by title")
         try:
-            resp = requests.get(
+            data = _get_json_cached(
+                "s2",
+                f"title:{title[:200]}",
                 "https://api.semanticscholar.org/graph/v1/paper/search",
-                params={"query": title[:200], "limit": 1, "fields": "openAccessPdf"},
-                timeout=timeout,
+                {"query": title[:200], "limit": 1, "fields": "openAccessPdf"},
+                timeout,
             )
-            if resp.status_code == 200:
-                results = resp.json().get("data", [])
+            if data is not None:
+                results = data.get("data", [])
                 if results:
                     oa = results[0].get("openAccessPdf") or {}
                     pdf_url = oa.get("url")
@@ -176,41 +463,129 @@ def _try_semantic_scholar(doi: str, title: str, timeout: int) -> Optional[bytes]
     if pdf_url:
         log.info("    [SemanticScholar] Trying %s", pdf_url[:80])
         try:
-            resp = requests.get(pdf_url, headers=HEADERS, timeout=timeout, allow_redirects=True)
-            if resp.status_code == 200 and _is_pdf(resp.content):
-                return resp.content
+            return _get_pdf(pdf_url, dest, timeout, max_bytes)
         except Exception:
             pass
-    return None
+    return False
+
+
+S2_BATCH_URL = "https://api.semanticscholar.org/graph/v1/paper/batch"
+S2_BATCH_SIZE = 500  # ids per request, the endpoint's maximum
+
+
+def _prefetch_semantic_scholar(dois: list[str], timeout: int):
+    """
+    Look up many DOIs with Semantic Scholar's batch endpoint and cache each
+    answer under the key _try_semantic_scholar uses, so its DOI lookups are
+    served from disk: one request per S2_BATCH_SIZE DOIs instead of one per
+    paper at 1 request/second. A DOI S2 does not know is cached as {} (no
+    PDF), the same outcome as the single lookup's 404.
+    """
+    todo = []
+    for doi in dict.fromkeys(dois):
+        try:
+            if time.time() - _api_cache_path("s2", f"doi:{doi}").stat().st_mtime < API_CACHE_TTL:
+                continue
+        except OSError:
+            pass
+        todo.append(doi)
+
+    for start in range(0, len(todo), S2_BATCH_SIZE):
+        batch = todo[start:start + S2_BATCH_SIZE]
+        log.info("  [SemanticScholar] Batch lookup of %d DOIs", len(batch))
+        try:
+            resp = _get_with_retry(
+                S2_BATCH_URL,
+                method="POST",
+                params={"fields": "openAccessPdf"},
+                json={"ids": [f"DOI:{doi}" for doi in batch]},
+                timeout=timeout,
+            )
+            if resp.status_code != 200:
+                log.debug("  [SemanticScholar] Batch lookup returned %d", resp.status_code)
+                continue
+            results = resp.json()
+        except Exception as e:
+            log.debug("  [SemanticScholar] Batch lookup failed: %s", e)
+            continue
+        # One entry per id, in request order; anything else is left to the
+        # per-paper lookups
+        if not isinstance(results, list) or len(results) != len(batch):
+            continue
+        for doi, data in zip(batch, results):
+            _cache_json("s2", _api_cache_path("s2", f"doi:{doi}"), data or {})
 
 
 # ---------------------------------------------------------------------------
 # Source 4: NBER direct PDF
 # ---------------------------------------------------------------------------
 
-def _try_nber_direct(url: str, timeout: int) -> Optional[bytes]:
+def _try_nber_direct(
+    url: str, dest: Path, timeout: int, max_bytes: int = MAX_PDF_BYTES
+) -> bool:
     if not url or "nber.org" not in url:
-        return None
+        return False
     # Extract paper number from URL like https://www.nber.org/papers/w34862
-    match = re.search(r"/papers/(w\d+)", url)
+    match = _RE_NBER_PAPER.search(url)
     if not match:
-        return None
+        return False
     paper_num = match.group(1)
     pdf_url = f"https://www.nber.org/system/files/working_papers/{paper_num}/{paper_num}.pdf"
     log.info("    [NBER Direct] Trying %s", pdf_url)
     try:
-        resp = requests.get(pdf_url, headers=HEADERS, timeout=timeout, allow_redirects=True)
-        if resp.status_code == 200 and _is_pdf(resp.content):
-            return resp.content
+        return _get_pdf(pdf_url, dest, timeout, max_bytes)
     except Exception as e:
         log.debug("    [NBER Direct] Failed: %s", e)
-    return None
+    return False
 
 
 # ---------------------------------------------------------------------------
 # Main download orchestrator
 # ---------------------------------------------------------------------------
 
+# Fallback order when download.sources is not set in config.yaml. NBER only
+# applies to nber.org papers, so for everything else OpenAlex leads.
+DEFAULT_SOURCE_ORDER = ["nber", "openalex", "unpaywall", "semantic_scholar"]
+
+
+def _fetch_pdf(
+    paper: dict, dest: Path, email: str, timeout: int, max_bytes: int, order: list[str]
+) -> tuple[Optional[str], list[str]]:
+    """
+    Walk the fallback chain for one paper in `order`. Returns the name of
+    the source that saved a PDF to dest (None if none did) and the names of
+    the sources tried.
+    """
+    title = paper.get("title", "untitled")
+    doi = _clean_doi(paper.get("doi", ""))
+    url = paper.get("url", "") or ""
+    oa_url = paper.get("oa_url", "")
+    log.info("  Fetching: %s", title[:70])
+
+    # Only sources the paper's metadata can feed
+    sources = {}
+    if "nber.org" in url:
+        sources["nber"] = (_try_nber_direct, (url, dest, timeout, max_bytes))
+    if oa_url:
+        sources["openalex"] = (_try_openalex_oa, (oa_url, dest, timeout, max_bytes))
+    if doi:
+        sources["unpaywall"] = (_try_unpaywall, (doi, email, dest, timeout, max_bytes))
+    if doi or title:
+        sources["semantic_scholar"] = (
+            _try_semantic_scholar, (doi, title, dest, timeout, max_bytes)
+        )
+
+    tried = []
+    for name in order:
+        if name not in sources:
+            continue
+        fn, args = sources[name]
+        tried.append(name)
+        if fn(*args):
+            return name, tried
+    return None, tried
+
+
 def download_papers(papers: list[dict], week_label: str) -> dict:
     """
     Attempt to download PDFs for a list of papers.
@@ -222,8 +597,7 @@ def download_papers(papers: list[dict], week_label: str) -> dict:
     Returns:
         dict with keys: downloaded (list of paths), manual (list of paper dicts)
     """
-    with open(CONFIG_PATH) as f:
-        cfg = yaml.safe_load(f)
+    cfg = _load_cfg(CONFIG_PATH.stat().st_mtime)
 
     dl_cfg = cfg.get("download", {})
     if not dl_cfg.get("enabled", True):
@@ -232,55 +606,61 @@ def download_papers(papers: list[dict], week_label: str) -> dict:
 
     email = cfg.get("email", "user@example.com")
     timeout = dl_cfg.get("timeout", 60)
+    max_bytes = int(dl_cfg.get("max_pdf_mb", 50) * 1024 * 1024)
+    order = dl_cfg.get("sources") or DEFAULT_SOURCE_ORDER
+    unknown = [name for name in order if name not in DEFAULT_SOURCE_ORDER]
+    if unknown:
+        log.warning("Ignoring unknown download sources: %s", ", ".join(unknown))
     base_dir = ROOT / dl_cfg.get("papers_dir", "output/weekly_reading/papers")
     week_dir = base_dir / week_label
     week_dir.mkdir(parents=True, exist_ok=True)
 
     downloaded = []
     manual = []
+    pending = []  # (paper, dest)
 
-    for i, paper in enumerate(papers, 1):
-        title = paper.get("title", "untitled")
-        doi = paper.get("doi", "")
-        url = paper.get("url", "")
-        oa_url = paper.get("oa_url", "")
-        journal = paper.get("journal", "")
+    # One directory listing instead of a stat per paper
+    with os.scandir(week_dir) as entries:
+        present = {e.name for e in entries}
 
-        safe_name = f"{i:02d}_{_sanitize_filename(title)}.pdf"
+    for i, paper in enumerate(papers, 1):
+        safe_name = f"{i:02d}_{_sanitize_filename(paper.get('title', 'untitled'))}.pdf"
         dest = week_dir / safe_name
-
-        if dest.exists():
+        if safe_name in present:
             log.info("  [%d/%d] Already downloaded: %s", i, len(papers), safe_name)
             downloaded.append(str(dest))
-            continue
-
-        log.info("  [%d/%d] %s", i, len(papers), title[:70])
-
-        pdf_bytes = None
-
-        # Fallback chain
-        pdf_bytes = _try_openalex_oa(oa_url, timeout)
-
-        if not pdf_bytes:
-            pdf_bytes = _try_unpaywall(doi, email, timeout)
-
-        if not pdf_bytes:
-            pdf_bytes = _try_semantic_scholar(doi, title, timeout)
-
-        if not pdf_bytes:
-            pdf_bytes = _try_nber_direct(url, timeout)
-
-        if pdf_bytes:
-            dest.write_bytes(pdf_bytes)
-            size_mb = len(pdf_bytes) / (1024 * 1024)
-            log.info("    ✓ Saved (%.1f MB): %s", size_mb, safe_name)
+        else:
+            pending.append((paper, dest))
+
+    # Semantic Scholar allows one request a second, so answer its DOI
+    # lookups for the whole batch up front
+    if "semantic_scholar" in order:
+        _prefetch_semantic_scholar(
+            [doi for doi in (_clean_doi(p.get("doi", "")) for p, _ in pending) if doi],
+            timeout,
+        )
+
+    # Papers are independent and I/O-bound, so fetch them concurrently;
+    # each worker streams straight to its own dest, and results come back
+    # in input order for reporting
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as ex:
+        results = list(ex.map(
+            lambda job: _fetch_pdf(*job, email, timeout, max_bytes, order), pending
+        ))
+
+    tried_counts: Counter = Counter()
+    hit_counts: Counter = Counter()
+    for (paper, dest), (source, tried) in zip(pending, results):
+        tried_counts.update(tried)
+        if source:
+            hit_counts[source] += 1
+            size_mb = dest.stat().st_size / (1024 * 1024)
+            log.info("    ✓ Saved via %s (%.1f MB): %s", source, size_mb, dest.name)
             downloaded.append(str(dest))
         else:
-            log.warning("    ✗ No OA PDF found — manual download needed")
+            log.warning("    ✗ No OA PDF found for %s — manual download needed", dest.name)
             manual.append(paper)
 
-        time.sleep(0.5)
-
     # Write a summary of what needs manual download
     if manual:
         manual_path = week_dir / "manual_downloads.md"
@@ -304,6 +684,11 @@ def download_papers(papers: list[dict], week_label: str) -> dict:
         "Download summary: %d/%d downloaded, %d need manual download",
         len(downloaded), len(papers), len(manual),
     )
+    if tried_counts:
+        log.info(
+            "  Source hits: %s",
+            ", ".join(f"{name} {hit_counts[name]}/{n}" for name, n in tried_counts.items()),
+        )
     return {"downloaded": downloaded, "manual": manual}
 
 
@@ -319,16 +704,19 @@ if __name__ == "__main__":
     week_label = args.week or datetime.now().strftime("%Y-%m-%d")
 
     DB_PATH = ROOT / "data" / "papers.db"
-    conn = sqlite3.connect(str(DB_PATH))
+    # Read-only autocommit connection; the file is already in WAL mode (init_db)
+    conn = sqlite3.connect(str(DB_PATH), isolation_level=None)
+    conn.execute("PRAGMA query_only=ON")
+    conn.row_factory = sqlite3.Row
     since = (datetime.now() - timedelta(days=7)).isoformat()
-    cursor = conn.execute(
-        """SELECT title, authors, doi, url, oa_url, journal
-           FROM papers WHERE fetched_at >= ?
-           ORDER BY relevant DESC LIMIT 7""",
-        (since,),
-    )
-    cols = [d[0] for d in cursor.description]
-    papers = [dict(zip(cols, row)) for row in cursor.fetchall()]
+    papers = [
+        dict(row) for row in conn.execute(
+            """SELECT title, authors, doi, url, oa_url, journal
+               FROM papers WHERE fetched_at >= ?
+               ORDER BY relevant DESC LIMIT 7""",
+            (since,),
+        )
+    ]
     conn.close()
 
     if papers:
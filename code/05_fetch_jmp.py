@@ -9,24 +9,37 @@ Runs once in December automatically (via launchd) or manually:
     python3 code/05_fetch_jmp.py --dry-run    # preview without writing to DB
 """
 
+import bisect
 import hashlib
+import json
 import logging
 import re
 import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import urljoin
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlparse
 
 import requests
 import yaml
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT / "config.yaml"
 DB_PATH = ROOT / "data" / "papers.db"
 JMP_MANUAL_PATH = ROOT / "data" / "jmp_candidates.yaml"
+HTTP_CACHE_DIR = ROOT / "data" / "cache" / "jmp"  # department pages + author lookups
+HTTP_CACHE_TTL = 6 * 3600  # seconds; reruns within this window skip the network
+PROFILE_CACHE_DIR = HTTP_CACHE_DIR / "mit_profiles"  # extracted JMP per profile URL
+PROFILE_CACHE_TTL = 7 * 24 * 3600  # seconds; a posted JMP rarely changes within a week
+# Statuses that mean "try again later"; an expired cached copy is served instead
+STALE_IF_ERROR_STATUSES = {429, 500, 502, 503, 504}
 
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +48,16 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def _load_cfg(mtime: float) -> dict:
+    """Parsed config.yaml; keyed on its mtime so edits are picked up."""
+    with open(CONFIG_PATH) as f:
+        return yaml.safe_load(f)
+
+
+# Shared keep-alive session: profile pages and API lookups mostly hit hosts
+# already connected to, so they skip the TCP/TLS handshake
 SESSION = requests.Session()
 SESSION.headers.update({
     "User-Agent": (
@@ -42,7 +65,83 @@ SESSION.headers.update({
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36"
     ),
+    # gzip/deflate, plus br/zstd when urllib3 has a decoder installed for them
+    "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
 })
+# Room for every scraper thread to hold a connection without blocking;
+# throttled or flaky department servers get a few backed-off retries
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+# The author-search APIs throttle bursts with 429 + Retry-After; wait that
+# out over more, longer retries rather than losing the candidate's lookup
+_api_adapter = HTTPAdapter(
+    max_retries=Retry(
+        total=5,
+        backoff_factor=1.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("https://api.semanticscholar.org/", _api_adapter)
+SESSION.mount("https://api.openalex.org/", _api_adapter)
+
+# Department pages scraped in parallel; job_market.concurrency overrides it
+SCRAPE_WORKERS = 8
+
+# Candidate profile pages fetched in parallel from one department's host
+PROFILE_WORKERS = 4
+
+# Requests in flight to any one host, however many threads want it; keeps
+# the department scrape and its profile fetches from piling onto a server
+PER_HOST_REQUESTS = 4
+_HOST_SLOTS: Dict[str, threading.Semaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+def _host_slot(url: str) -> threading.Semaphore:
+    host = urlparse(url).netloc.lower()
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.Semaphore(PER_HOST_REQUESTS)
+    return slot
+
+
+# Requests per second allowed to the author-search APIs, however many
+# resolver threads are running; other hosts are not paced
+API_RATES = {
+    "api.semanticscholar.org": 1.0,
+    "api.openalex.org": 10.0,
+}
+_NEXT_REQUEST: Dict[str, float] = {}  # host -> earliest time.monotonic() for its next request
+
+
+def _pace(url: str):
+    host = urlparse(url).netloc.lower()
+    rate = API_RATES.get(host)
+    if not rate:
+        return
+    with _HOST_SLOTS_LOCK:
+        now = time.monotonic()
+        start = max(now, _NEXT_REQUEST.get(host, now))
+        _NEXT_REQUEST[host] = start + 1 / rate
+    if start > now:
+        time.sleep(start - now)
+
+
+# Candidates resolved through the author-search APIs in parallel
+RESOLVE_WORKERS = 8
 
 # ================================================================
 # Department scraper definitions
@@ -144,24 +243,164 @@ DEPARTMENTS = [
 ]
 
 
-def _fetch_page(url: str, timeout: int = 20) -> Optional[BeautifulSoup]:
+# Patterns used per page / per candidate, compiled once
+_WS_RE = re.compile(r"\s+")
+_MIT_PROFILE_RE = re.compile(r"/people/phd-students/")
+_JMP_HEADING_RE = re.compile(r"Job\s+Market\s+Paper", re.I)
+_MARKET_BYTES_RE = re.compile(rb"market", re.I)  # raw-HTML precheck for _JMP_HEADING_RE
+_ABSTRACT_RE = re.compile(r"Abstract", re.I)
+_COMMA_NL_RE = re.compile(r"[,\n]")
+_STANFORD_JMP_RE = re.compile(r"Job Market Paper:\s*\n\s*(.+?)(?:\n|$)")
+_STANFORD_FIELDS_RE = re.compile(r"Fields of Study:\s*\n\s*(.+?)(?:\n|$)")
+_MAILTO_RE = re.compile(r"mailto:")
+_JMP_SPLIT_RE = re.compile(r"(?=Job Market Paper)")
+_QUOTED_RE = re.compile(r'["\u201c](.+?)["\u201d]')
+_RESEARCH_FOCUS_RE = re.compile(r"Research\s+Focus(es)?:?\s*")
+# A trailing JMP marker (and whatever follows it), else just the extension
+_FILE_STRIP_RE = re.compile(
+    r"[_-]?(jmp|job.?market|paper|draft|latest|v\d+|compressed).*$|\.(pdf|html?)$", re.I
+)
+_SEP_TO_SPACE = str.maketrans("_-", "  ")
+_COLUMBIA_RE = re.compile(
+    r"Candidate Name:\s*\[?([^\]\n]+)\]?"
+    r".*?Field\(s\):\s*([^\n]+)"
+    r".*?Paper Title:\s*\[?([^\]\n]+)\]?",
+    re.DOTALL
+)
+_PROGRAM_ENTRY_RE = re.compile(r"Program Entry(?:\s+\d{4})?")
+_ENTRY_SPLIT_RE = re.compile(r"(?=Program Entry)")
+_YEAR_RE = re.compile(r"\d{4}")
+# 2-5 whitespace-separated name words (letters, hyphens, apostrophes, dots)
+_NAME_SHAPE_RE = re.compile(
+    r"\s*(?:[A-Za-z\u00C0-\u024F\'\-\.]+\s+){1,4}[A-Za-z\u00C0-\u024F\'\-\.]+\s*"
+)
+_FIELD_WORD_RE = re.compile(
+    r"(economics|theory|finance|econometrics|trade|development|labor|public|health"
+    r"|industrial|political|behavioral|macro|micro)",
+    re.I,
+)
+_FIELD_SPLIT_RE = re.compile(r"[,\n;]")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _cached_get(url: str, params: Optional[dict] = None, timeout: int = 20) -> Tuple[int, bytes]:
+    """
+    GET url and return (status, body). 200 bodies are kept under
+    data/cache/jmp/ and served from there for HTTP_CACHE_TTL. After that
+    the request is conditional on the stored ETag / Last-Modified, so an
+    unchanged page costs a bodiless 304. If the live request fails (a
+    network error, or a throttled/server-error status after retries), an
+    expired copy is used instead of giving up.
+    """
+    key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    path = HTTP_CACHE_DIR / hashlib.sha1(key.encode()).hexdigest()
+    validators_path = path.with_suffix(".validators")
+    try:
+        age = time.time() - path.stat().st_mtime
+    except OSError:
+        age = None
+    if age is not None and age < HTTP_CACHE_TTL:
+        return 200, path.read_bytes()
+
+    headers = {}
+    if age is not None:
+        try:
+            validators = json.loads(validators_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            validators = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
     try:
-        resp = SESSION.get(url, timeout=timeout)
-        if resp.status_code != 200:
-            log.warning("  HTTP %d for %s", resp.status_code, url)
+        with _host_slot(url):
+            _pace(url)
+            resp = SESSION.get(url, params=params, timeout=timeout, headers=headers)
+    except requests.RequestException as e:
+        if age is None:
+            raise
+        log.info("  Using cached copy of %s (%s)", url, e)
+        return 200, path.read_bytes()
+    if resp.status_code == 304 and age is not None:
+        path.touch()  # still current; restart its TTL
+        return 200, path.read_bytes()
+    if resp.status_code in STALE_IF_ERROR_STATUSES and age is not None:
+        log.info("  Using cached copy of %s (HTTP %d)", url, resp.status_code)
+        return 200, path.read_bytes()
+    if resp.status_code == 200:
+        try:
+            HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(resp.content)
+            validators_path.write_text(json.dumps({
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }), encoding="utf-8")
+        except OSError as e:
+            log.debug("  Could not cache %s: %s", url, e)
+    return resp.status_code, resp.content
+
+
+def _fetch_page(
+    url: str, timeout: int = 20, must_match: Optional[re.Pattern] = None
+) -> Optional[BeautifulSoup]:
+    """
+    Fetch and parse url. With must_match, a page whose raw bytes don't
+    match it is not parsed at all (None), since parsing dominates the cost.
+    """
+    try:
+        status, body = _cached_get(url, timeout=timeout)
+        if status != 200:
+            log.warning("  HTTP %d for %s", status, url)
+            return None
+        if must_match is not None and not must_match.search(body):
             return None
-        return BeautifulSoup(resp.text, "html.parser")
+        # Raw bytes let BeautifulSoup honor the page's own <meta charset>
+        # instead of requests' ISO-8859-1 guess for charset-less text/html
+        return BeautifulSoup(body, "html.parser")
     except Exception as e:
         log.warning("  Failed to fetch %s: %s", url, e)
         return None
 
 
+@lru_cache(maxsize=8192)
 def _clean_text(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
-
-
+    return _WS_RE.sub(" ", s).strip()
+
+
+def _iter_text_lines(el) -> Iterator[str]:
+    """
+    Non-empty stripped lines of el's text, as get_text(separator="\n")
+    split on newlines would give them, without building the page string.
+    """
+    for s in el.stripped_strings:
+        for line in s.split("\n"):
+            line = line.strip()
+            if line:
+                yield line
+
+
+def _iter_blocks(lines: Iterable[str], split_re: re.Pattern) -> Iterator[List[str]]:
+    """
+    Group lines into the blocks split_re (a lookahead for a marker) would
+    cut the joined text into: every block after the first starts with the
+    marker. Each block is yielded as soon as it is complete.
+    """
+    block: List[str] = []
+    for line in lines:
+        first, *rest = split_re.split(line)
+        if first.strip():
+            block.append(first.strip())
+        for piece in rest:
+            yield block
+            block = [piece.strip()]
+    yield block
+
+
+@lru_cache(maxsize=8192)
 def _looks_like_pdf(url: str) -> bool:
-    return url.lower().endswith(".pdf") or "pdf" in url.lower()
+    # A ".pdf" ending contains "pdf", so one substring test covers both
+    return "pdf" in url.lower()
 
 
 # ----------------------------------------------------------------
@@ -173,8 +412,9 @@ def _parse_mit(soup: BeautifulSoup, base_url: str) -> List[dict]:
     candidates = []
     # MIT lists candidates as linked names followed by field text
     # Find all links to individual profile pages
-    profile_links = soup.find_all("a", href=re.compile(r"/people/phd-students/"))
+    profile_links = soup.find_all("a", href=_MIT_PROFILE_RE)
     seen_names = set()
+    listed = []  # (name, profile_url, fields_text)
 
     for link in profile_links:
         name = _clean_text(link.get_text())
@@ -193,32 +433,69 @@ def _parse_mit(soup: BeautifulSoup, base_url: str) -> List[dict]:
             raw = parent.get_text(separator="|")
             parts = [p.strip() for p in raw.split("|") if p.strip() and p.strip() != name]
             fields_text = ", ".join(parts)
-
-        # Fetch individual profile page for JMP details
-        paper_title, paper_url, abstract = _scrape_mit_profile(profile_url)
-
-        candidates.append({
-            "name": name,
-            "school": "MIT",
-            "fields": [f.strip() for f in fields_text.split(",") if f.strip()] if fields_text else [],
-            "paper_title": paper_title,
-            "paper_url": paper_url,
-            "abstract": abstract,
-            "website": profile_url,
-        })
-        time.sleep(0.3)
+        listed.append((name, profile_url, fields_text))
+
+    # Fetch individual profile pages for JMP details, a few at a time
+    with ThreadPoolExecutor(max_workers=PROFILE_WORKERS) as ex:
+        profiles = ex.map(_scrape_mit_profile, [url for _, url, _ in listed])
+        for (name, profile_url, fields_text), (paper_title, paper_url, abstract) in zip(
+            listed, profiles
+        ):
+            candidates.append({
+                "name": name,
+                "school": "MIT",
+                "fields": [f.strip() for f in fields_text.split(",") if f.strip()] if fields_text else [],
+                "paper_title": paper_title,
+                "paper_url": paper_url,
+                "abstract": abstract,
+                "website": profile_url,
+            })
 
     return candidates
 
 
 def _scrape_mit_profile(url: str) -> Tuple[str, str, str]:
+    """
+    JMP title, URL and abstract from an MIT candidate profile. Found JMPs
+    are remembered for PROFILE_CACHE_TTL, so reruns skip the profile fetch;
+    profiles without one are checked again next run.
+    """
+    path = PROFILE_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+    try:
+        if time.time() - path.stat().st_mtime < PROFILE_CACHE_TTL:
+            return tuple(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        pass
+
+    result = _extract_mit_profile(url)
+    if result[0]:
+        try:
+            PROFILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(result), encoding="utf-8")
+        except OSError as e:
+            log.debug("  Could not cache profile %s: %s", url, e)
+    return result
+
+
+def _extract_mit_profile(url: str) -> Tuple[str, str, str]:
     """Fetch an MIT candidate profile page and extract JMP title, URL, abstract."""
-    soup = _fetch_page(url)
+    # Profiles without a "Job Market Paper" heading have nothing to extract
+    soup = _fetch_page(url, must_match=_MARKET_BYTES_RE)
     if not soup:
         return "", "", ""
 
-    # Look for "Job Market Paper" heading
-    jmp_heading = soup.find(string=re.compile(r"Job\s+Market\s+Paper", re.I))
+    # First "Job Market Paper" heading and first "Abstract" string, found
+    # in one walk over the document's text nodes
+    jmp_heading = abstract_el = None
+    for node in soup.descendants:
+        if not isinstance(node, NavigableString):
+            continue
+        if jmp_heading is None and _JMP_HEADING_RE.search(node):
+            jmp_heading = node
+        if abstract_el is None and _ABSTRACT_RE.search(node):
+            abstract_el = node
+        if jmp_heading is not None and abstract_el is not None:
+            break
     if not jmp_heading:
         return "", "", ""
 
@@ -239,8 +516,6 @@ def _scrape_mit_profile(url: str) -> Tuple[str, str, str]:
             paper_url = link["href"]
             break
 
-    # Look for abstract
-    abstract_el = soup.find(string=re.compile(r"Abstract", re.I))
     if abstract_el:
         parent = abstract_el.find_parent()
         if parent:
@@ -272,7 +547,7 @@ def _parse_harvard(soup: BeautifulSoup, base_url: str) -> List[dict]:
         if next_el:
             fields_text = _clean_text(next_el.get_text())
             # Fields are typically separated by newlines in the source
-            fields = [f.strip() for f in re.split(r"[,\n]", fields_text) if f.strip() and len(f.strip()) > 3]
+            fields = [f.strip() for f in _COMMA_NL_RE.split(fields_text) if f.strip() and len(f.strip()) > 3]
 
         # Try to find a link to their personal page
         link = h.find("a")
@@ -320,17 +595,17 @@ def _parse_stanford(soup: BeautifulSoup, base_url: str) -> List[dict]:
         text_block = container.get_text(separator="\n")
 
         # Extract paper title
-        jmp_match = re.search(r"Job Market Paper:\s*\n\s*(.+?)(?:\n|$)", text_block)
+        jmp_match = _STANFORD_JMP_RE.search(text_block)
         if jmp_match:
             paper_title = jmp_match.group(1).strip()
 
         # Extract fields
-        fields_match = re.search(r"Fields of Study:\s*\n\s*(.+?)(?:\n|$)", text_block)
+        fields_match = _STANFORD_FIELDS_RE.search(text_block)
         if fields_match:
             fields = [f.strip() for f in fields_match.group(1).split(",") if f.strip()]
 
         # Look for email link or personal website link
-        email_link = container.find("a", href=re.compile(r"mailto:"))
+        email_link = container.find("a", href=_MAILTO_RE)
         if email_link:
             email = email_link["href"].replace("mailto:", "")
 
@@ -367,91 +642,72 @@ def _parse_chicago(soup: BeautifulSoup, base_url: str) -> List[dict]:
     #   Job Market Paper: "Title"
     #   References: ...
     main = soup.find("main") or soup.find("div", role="main") or soup
-    text = main.get_text(separator="\n")
 
-    # Split into candidate blocks by "Job Market Paper"
-    blocks = re.split(r"(?=Job Market Paper)", text)
+    # One pass over the links: link text -> first href for the title -> PDF
+    # lookup, plus the links whose text may itself be an unquoted title
+    quotes = '"\u201c\u201d '
+    href_by_text = {}
+    title_links = []
+    for link in soup.find_all("a", href=True):
+        href = link["href"]
+        link_text = _clean_text(link.get_text())
+        href_by_text.setdefault(link_text.strip(quotes), href)
+        if (link_text and len(link_text) > 15 and
+            any(ext in href.lower() for ext in [".pdf", "drive.google", "dropbox"])):
+            title_links.append(link_text)
+
+    # Name and fields come from the last "Research Focuses" line before each
+    # block (the name is the line just above it); carried forward while the
+    # blocks are walked in page order
+    name = ""
+    fields = []
+    prev_line = ""
+
+    # Split into candidate blocks by "Job Market Paper"; every block but
+    # the page preamble starts with it
+    blocks = _iter_blocks(_iter_text_lines(main), _JMP_SPLIT_RE)
+    for i, block in enumerate(blocks):
+        lines = [l for l in block if l]
+
+        if i > 0:
+            # Extract paper title (text in quotes or after "Job Market Paper")
+            title = ""
+            for line in lines:
+                if "Job Market Paper" in line:
+                    continue
+                # Look for quoted title or a line that's a reasonable title
+                match = _QUOTED_RE.search(line)
+                if match:
+                    title = match.group(1).strip()
+                    break
 
-    for block in blocks:
-        if "Job Market Paper" not in block:
-            continue
-        lines = [l.strip() for l in block.split("\n") if l.strip()]
+            # If no quoted title, find the link text
+            if not title:
+                title = next((t for t in title_links if any(t in l for l in lines)), "")
+
+            if title:
+                paper_url = href_by_text.get(title.strip(quotes), "")
+                candidates.append({
+                    "name": name or _name_from_url(paper_url) or "Unknown",
+                    "school": "Chicago",
+                    "fields": list(fields),
+                    "paper_title": title,
+                    "paper_url": paper_url,
+                    "abstract": "",
+                    "website": "",
+                })
 
-        # Extract paper title (text in quotes or after "Job Market Paper")
-        title = ""
         for line in lines:
-            if "Job Market Paper" in line:
-                continue
-            # Look for quoted title or a line that's a reasonable title
-            match = re.search(r'["\u201c](.+?)["\u201d]', line)
-            if match:
-                title = match.group(1).strip()
-                break
-
-        # If no quoted title, find the link text
-        if not title:
-            for link in soup.find_all("a", href=True):
-                href = link["href"]
-                link_text = _clean_text(link.get_text())
-                if (link_text and len(link_text) > 15 and
-                    any(ext in href.lower() for ext in [".pdf", "drive.google", "dropbox"])):
-                    if link_text in block:
-                        title = link_text
-                        break
-
-        if not title:
-            continue
-
-        # Find PDF URL for this title
-        paper_url = ""
-        for link in soup.find_all("a", href=True):
-            if _clean_text(link.get_text()).strip('""\u201c\u201d ') == title.strip('""\u201c\u201d '):
-                paper_url = link["href"]
-                break
-
-        # Look backwards in the original text for the candidate name
-        # The name appears a few lines before "Job Market Paper"
-        jmp_pos = text.find("Job Market Paper")
-        if jmp_pos == -1:
-            jmp_pos = text.find(title[:30])
-        # Find the block before this occurrence
-        pre_text = text[:text.find(block[:50]) + 1] if block[:50] in text else ""
-        pre_lines = [l.strip() for l in pre_text.split("\n") if l.strip()]
-
-        name = ""
-        fields = []
-        # Walk backward to find name and fields
-        for i in range(len(pre_lines) - 1, -1, -1):
-            line = pre_lines[i]
             if "Research Focuses" in line or "Research Focus" in line:
-                fields_text = re.sub(r"Research\s+Focus(es)?:?\s*", "", line)
+                fields_text = _RESEARCH_FOCUS_RE.sub("", line)
                 fields = [f.strip() for f in fields_text.split(",") if f.strip() and len(f.strip()) > 3]
-                # Name is typically the line before "Research Focuses"
-                if i > 0:
-                    candidate_name = pre_lines[i - 1].strip()
-                    if _is_plausible_name(candidate_name):
-                        name = candidate_name
-                break
-
-        if not name:
-            name = _name_from_url(paper_url) or "Unknown"
-
-        candidates.append({
-            "name": name,
-            "school": "Chicago",
-            "fields": fields,
-            "paper_title": title,
-            "paper_url": paper_url,
-            "abstract": "",
-            "website": "",
-        })
-
-        # Remove this block from text to avoid re-matching
-        text = text.replace(block[:50], "", 1)
+                name = prev_line if _is_plausible_name(prev_line) else ""
+            prev_line = line
 
     return candidates
 
 
+@lru_cache(maxsize=8192)
 def _name_from_url(url: str) -> str:
     """Try to extract a person's name from a JMP URL."""
     # Common patterns: .../lastName_JMP.pdf, .../FirstName_LastName_JMP.pdf
@@ -463,9 +719,7 @@ def _name_from_url(url: str) -> str:
             return username.replace("-", " ").title()
     # Try filename
     filename = parts[-1] if parts else ""
-    filename = re.sub(r"\.(pdf|html?)$", "", filename, flags=re.I)
-    filename = re.sub(r"[_-]?(jmp|job.?market|paper|draft|latest|v\d+|compressed).*$", "", filename, flags=re.I)
-    filename = filename.replace("_", " ").replace("-", " ").strip()
+    filename = _FILE_STRIP_RE.sub("", filename).translate(_SEP_TO_SPACE).strip()
     words = filename.split()
     if 2 <= len(words) <= 4 and all(w.isalpha() for w in words):
         return filename.title()
@@ -477,7 +731,7 @@ def _name_from_url(url: str) -> str:
 # ----------------------------------------------------------------
 
 def _parse_columbia(soup: BeautifulSoup, base_url: str) -> List[dict]:
-    candidates = []
+    candidates = {}  # by name; the first listing of a candidate wins
 
     # Columbia has each candidate in a section with links
     # Pattern: [Name](website), Fields, [Paper Title](pdf_url), Advisors
@@ -499,49 +753,52 @@ def _parse_columbia(soup: BeautifulSoup, base_url: str) -> List[dict]:
               "sites.google" in href) and len(text.split()) <= 5:
             candidate_links.append((text, href, link))
 
+    # Position of the first PDF link with each (case-insensitive) title
+    exact_link = {}
+    for i, (pt, _, _) in enumerate(paper_links):
+        exact_link.setdefault(pt.lower(), i)
+
     # Also extract from the "Candidate Name:" pattern in text
     text_content = soup.get_text()
-    name_pattern = re.compile(
-        r"Candidate Name:\s*\[?([^\]\n]+)\]?"
-        r".*?Field\(s\):\s*([^\n]+)"
-        r".*?Paper Title:\s*\[?([^\]\n]+)\]?",
-        re.DOTALL
-    )
-
-    for match in name_pattern.finditer(text_content):
+    for match in _COLUMBIA_RE.finditer(text_content):
         name = _clean_text(match.group(1))
-        fields_str = _clean_text(match.group(2))
         paper_title = _clean_text(match.group(3))
+        if not name or not paper_title or name in candidates:
+            continue
+        fields_str = _clean_text(match.group(2))
 
-        # Find the PDF URL for this paper
+        # Find the PDF URL for this paper: the first link whose title is
+        # similar enough. An identical title is such a link, so only the
+        # links before it need the word-overlap comparison.
         paper_url = ""
-        for pt, pu, _ in paper_links:
-            if _title_similarity(paper_title.lower(), pt.lower()) > 0.5:
+        n_words = len(_title_words(paper_title))
+        exact = exact_link.get(paper_title.lower()) if n_words else None
+        for pt, pu, _ in paper_links[:exact]:
+            # Overlap can't beat the shorter/longer word-count ratio, so
+            # links of very different length are skipped without comparing
+            n_pt = len(_title_words(pt))
+            if min(n_words, n_pt) <= 0.5 * max(n_words, n_pt):
+                continue
+            if _title_similarity(paper_title, pt) > 0.5:
                 paper_url = pu
                 break
+        else:
+            if exact is not None:
+                paper_url = paper_links[exact][1]
 
         fields = [f.strip() for f in fields_str.split(",") if f.strip()]
 
-        if name and paper_title:
-            candidates.append({
-                "name": name,
-                "school": "Columbia",
-                "fields": fields,
-                "paper_title": paper_title,
-                "paper_url": paper_url,
-                "abstract": "",
-                "website": "",
-            })
-
-    # Deduplicate by name
-    seen = set()
-    unique = []
-    for c in candidates:
-        if c["name"] not in seen:
-            seen.add(c["name"])
-            unique.append(c)
+        candidates[name] = {
+            "name": name,
+            "school": "Columbia",
+            "fields": fields,
+            "paper_title": paper_title,
+            "paper_url": paper_url,
+            "abstract": "",
+            "website": "",
+        }
 
-    return unique
+    return list(candidates.values())
 
 
 # ----------------------------------------------------------------
@@ -553,12 +810,18 @@ def _parse_berkeley(soup: BeautifulSoup, base_url: str) -> List[dict]:
     # Berkeley format: blocks separated by "Program Entry YYYY"
     # Each block: "LastName, FirstName" / Fields / Website / Email
     main = soup.find("main") or soup
-    text = main.get_text(separator="\n")
 
-    blocks = re.split(r"Program Entry(?:\s+\d{4})?", text)
-
-    for block in blocks[1:]:
-        lines = [l.strip() for l in block.strip().split("\n") if l.strip()]
+    blocks = _iter_blocks(_iter_text_lines(main), _ENTRY_SPLIT_RE)
+    next(blocks)  # text before the first entry
+    for block in blocks:
+        # Drop the "Program Entry YYYY" marker; a year on the following
+        # line still belongs to it
+        marker = _PROGRAM_ENTRY_RE.match(block[0])
+        block[0] = block[0][marker.end():].strip()
+        year_on_next_line = not block[0] and marker.group() == "Program Entry"
+        if year_on_next_line and len(block) > 1 and _YEAR_RE.match(block[1]):
+            block[1] = block[1][4:].strip()
+        lines = [l for l in block if l]
         if len(lines) < 2:
             continue
 
@@ -611,7 +874,7 @@ def _parse_berkeley(soup: BeautifulSoup, base_url: str) -> List[dict]:
 # Name validation helpers
 # ----------------------------------------------------------------
 
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     "undergraduate students", "graduate students", "after stanford",
     "contact us", "main menu", "social menu", "footer menu",
     "current students", "program rules", "frequently used forms",
@@ -631,40 +894,43 @@ STOP_WORDS = {
     "frequently asked questions", "get advice", "course offerings",
     "major requirements", "course selection", "common questions",
     "prospective majors", "graduate student directory",
-}
+})
 
+# Words that never appear in a person's name
+BAD_NAME_WORDS = frozenset({
+    "university", "economics", "department", "professor", "faculty",
+    "program", "students", "candidates", "menu", "search", "contact",
+    "about", "resources", "news", "events", "seminars", "research",
+    "teaching", "academic", "positions", "affiliated", "pursuing",
+    "placement", "information", "admissions", "financial", "support",
+    "independent", "study", "committee", "director", "history",
+    "advisor", "advisors", "non-academic", "view", "download",
+    "policy", "requirements", "offerings", "directory", "majors",
+    "essay", "credit", "questions", "advice", "magazine", "team",
+    "privacy", "links", "site", "people", "all", "our", "join",
+    "annual", "senior", "double", "common", "related", "course",
+    "selection", "get", "prospective", "graduate",
+})
 
+
+@lru_cache(maxsize=4096)
 def _is_plausible_name(text: str) -> bool:
-    """Check if a string looks like a person name (not navigation/heading garbage)."""
-    if not text:
+    """
+    Check if a string looks like a person name (not navigation/heading
+    garbage). Cached: the same headings recur across pages and parsers.
+    """
+    # Word count and word shape in one regex pass; this rejects most
+    # navigation text (digits, punctuation, long phrases) up front
+    if not text or not _NAME_SHAPE_RE.fullmatch(text):
         return False
     text_lower = text.lower().strip()
     if text_lower in STOP_WORDS:
         return False
     words = text.split()
-    if len(words) < 2 or len(words) > 5:
-        return False
     if not all(w[0].isupper() for w in words if len(w) > 1):
         return False
     # Reject if any word is a common non-name word
-    bad_words = {
-        "university", "economics", "department", "professor", "faculty",
-        "program", "students", "candidates", "menu", "search", "contact",
-        "about", "resources", "news", "events", "seminars", "research",
-        "teaching", "academic", "positions", "affiliated", "pursuing",
-        "placement", "information", "admissions", "financial", "support",
-        "independent", "study", "committee", "director", "history",
-        "advisor", "advisors", "non-academic", "view", "download",
-        "policy", "requirements", "offerings", "directory", "majors",
-        "essay", "credit", "questions", "advice", "magazine", "team",
-        "privacy", "links", "site", "people", "all", "our", "join",
-        "annual", "senior", "double", "common", "related", "course",
-        "selection", "get", "prospective", "graduate",
-    }
-    if any(w.lower() in bad_words for w in words):
-        return False
-    # All words should be reasonable name words (letters, hyphens, apostrophes)
-    if not all(re.match(r"^[A-Za-z\u00C0-\u024F\'\-\.]+$", w) for w in words):
+    if not BAD_NAME_WORDS.isdisjoint(w.lower() for w in words):
         return False
     return True
 
@@ -713,9 +979,9 @@ def _parse_generic(soup: BeautifulSoup, base_url: str, school: str) -> List[dict
             block_text = container.get_text(separator="\n")
             for line in block_text.split("\n"):
                 line = line.strip()
-                if re.search(r"(economics|theory|finance|econometrics|trade|development|labor|public|health|industrial|political|behavioral|macro|micro)", line, re.I):
+                if _FIELD_WORD_RE.search(line):
                     if len(line) < 200 and name not in line:
-                        fields = [f.strip() for f in re.split(r"[,\n;]", line) if f.strip() and len(f.strip()) > 3]
+                        fields = [f.strip() for f in _FIELD_SPLIT_RE.split(line) if f.strip() and len(f.strip()) > 3]
                         break
 
         candidates.append({
@@ -744,6 +1010,14 @@ def _parse_generic(soup: BeautifulSoup, base_url: str, school: str) -> List[dict
                 if all(w[0].isupper() and w.isalpha() for w in words):
                     name_links.append((text, href, link))
 
+        # PDF links ordered by source line, so each name finds the first
+        # PDF below it with one bisect
+        pdf_by_line = sorted(
+            ((pl.sourceline, pt, pu) for pt, pu, pl in pdf_links if pl.sourceline),
+            key=lambda x: x[0],
+        )
+        pdf_lines = [line for line, _, _ in pdf_by_line]
+
         # Try to pair names with papers
         for name, href, link in name_links:
             if name in seen_names:
@@ -754,13 +1028,11 @@ def _parse_generic(soup: BeautifulSoup, base_url: str, school: str) -> List[dict
             # Find the nearest PDF link after this name link
             paper_title = ""
             paper_url = ""
-            for pt, pu, pl in pdf_links:
+            if link.sourceline:
+                i = bisect.bisect_right(pdf_lines, link.sourceline)
                 # Check if this PDF is "close" in DOM position
-                if link.sourceline and pl.sourceline:
-                    if 0 < pl.sourceline - link.sourceline < 30:
-                        paper_title = pt
-                        paper_url = pu
-                        break
+                if i < len(pdf_by_line) and pdf_lines[i] - link.sourceline < 30:
+                    _, paper_title, paper_url = pdf_by_line[i]
 
             candidates.append({
                 "name": name,
@@ -780,9 +1052,15 @@ def _parse_generic(soup: BeautifulSoup, base_url: str, school: str) -> List[dict
 # for candidates where scraping didn't find the JMP title.
 # ================================================================
 
+@lru_cache(maxsize=8192)
+def _title_words(s: str) -> frozenset:
+    return frozenset(_WORD_RE.findall(s.lower()))
+
+
 def _title_similarity(a: str, b: str) -> float:
-    words_a = set(re.findall(r"\w+", a.lower()))
-    words_b = set(re.findall(r"\w+", b.lower()))
+    """Shared-word fraction of the wordier title (word-set overlap)."""
+    words_a = _title_words(a)
+    words_b = _title_words(b)
     if not words_a or not words_b:
         return 0.0
     return len(words_a & words_b) / max(len(words_a), len(words_b))
@@ -791,27 +1069,27 @@ def _title_similarity(a: str, b: str) -> float:
 def _search_semantic_scholar_by_author(name: str) -> Optional[dict]:
     """Search Semantic Scholar for recent papers by an author."""
     try:
-        resp = SESSION.get(
+        status, body = _cached_get(
             "https://api.semanticscholar.org/graph/v1/paper/search",
             params={
                 "query": name,
                 "limit": 5,
-                "fields": "title,authors,abstract,url,openAccessPdf,externalIds,year",
+                "fields": "title,authors,abstract,openAccessPdf,externalIds",
                 "year": f"{datetime.now().year - 1}-{datetime.now().year}",
             },
             timeout=15,
         )
-        if resp.status_code != 200:
+        if status != 200:
             return None
-        results = resp.json().get("data", [])
+        results = json.loads(body).get("data", [])
         if not results:
             return None
 
-        name_parts = set(name.lower().split())
+        name_parts = frozenset(name.lower().split())
         for r in results:
             for author in r.get("authors", []):
-                author_parts = set(author.get("name", "").lower().split())
-                if len(name_parts & author_parts) >= 2:
+                # intersection() takes the split list as is; no set per author
+                if len(name_parts.intersection(author.get("name", "").lower().split())) >= 2:
                     return r
         return None
     except Exception as e:
@@ -819,30 +1097,40 @@ def _search_semantic_scholar_by_author(name: str) -> Optional[dict]:
         return None
 
 
+# OpenAlex concept "Economics"; author searches only return works tagged with it
+OPENALEX_ECONOMICS_CONCEPT = "C162324750"
+
+
 def _search_openalex_by_author(name: str, email: str) -> Optional[dict]:
-    """Search OpenAlex for recent works by author name."""
+    """Search OpenAlex for recent economics works by author name."""
     try:
-        resp = SESSION.get(
+        status, body = _cached_get(
             "https://api.openalex.org/works",
             params={
-                "filter": f"raw_author_name.search:{name},from_publication_date:{datetime.now().year - 1}-01-01",
+                "filter": (
+                    f"raw_author_name.search:{name},"
+                    f"from_publication_date:{datetime.now().year - 1}-01-01,"
+                    f"concepts.id:{OPENALEX_ECONOMICS_CONCEPT}"
+                ),
                 "sort": "publication_date:desc",
                 "per_page": 5,
+                # Only the fields _resolve_missing_metadata reads
+                "select": "title,authorships,primary_location,abstract_inverted_index,open_access,doi",
                 "mailto": email,
             },
             timeout=15,
         )
-        if resp.status_code != 200:
+        if status != 200:
             return None
-        results = resp.json().get("results", [])
+        results = json.loads(body).get("results", [])
         if not results:
             return None
 
-        name_parts = set(name.lower().split())
+        name_parts = frozenset(name.lower().split())
         for r in results:
             for auth in r.get("authorships", []):
-                author_parts = set(auth.get("author", {}).get("display_name", "").lower().split())
-                if len(name_parts & author_parts) >= 2:
+                author_name = auth.get("author", {}).get("display_name", "")
+                if len(name_parts.intersection(author_name.lower().split())) >= 2:
                     return r
         return None
     except Exception as e:
@@ -850,24 +1138,30 @@ def _search_openalex_by_author(name: str, email: str) -> Optional[dict]:
         return None
 
 
+# Title/venue words that mark a paper as from another field
+NON_ECON_TERMS = (
+    "cell", "protein", "gene", "genome", "molecular", "clinical",
+    "patient", "diagnosis", "therapy", "surgical", "cancer", "tumor",
+    "neuron", "cortex", "patholog", "symptom", "virus", "bacteria",
+    "phylogen", "species", "ecosystem", "lattice", "quantum",
+    "photon", "magnetic", "spectroscop", "chemical", "polymer",
+    "alloy", "crystal", "nanoparticle", "enzyme", "amino acid",
+    "morpholog", "treadmill", "phage", "immortality",
+    "derivatization", "lc-ms", "icp-ms", "spc versus", "hypert",
+    "drone", "cybersec", "murine", "transcriptom", "decalcified",
+    "innovator", "llm", "deep learning", "neural network",
+    "scaling law", "pre-training", "trigger",
+)
+# One alternation, so the text is scanned once rather than once per term
+_NON_ECON_RE = re.compile("|".join(map(re.escape, NON_ECON_TERMS)))
+
+
+@lru_cache(maxsize=4096)
 def _is_economics_paper(title: str, venue: str = "") -> bool:
     """Heuristic check that a paper is likely economics, not biology/physics/etc."""
     text = (title + " " + venue).lower()
     # Reject if clearly from another field
-    non_econ = [
-        "cell", "protein", "gene", "genome", "molecular", "clinical",
-        "patient", "diagnosis", "therapy", "surgical", "cancer", "tumor",
-        "neuron", "cortex", "patholog", "symptom", "virus", "bacteria",
-        "phylogen", "species", "ecosystem", "lattice", "quantum",
-        "photon", "magnetic", "spectroscop", "chemical", "polymer",
-        "alloy", "crystal", "nanoparticle", "enzyme", "amino acid",
-        "morpholog", "treadmill", "phage", "immortality",
-        "derivatization", "lc-ms", "icp-ms", "spc versus", "hypert",
-        "drone", "cybersec", "murine", "transcriptom", "decalcified",
-        "innovator", "llm", "deep learning", "neural network",
-        "scaling law", "pre-training", "trigger",
-    ]
-    if any(w in text for w in non_econ):
+    if _NON_ECON_RE.search(text):
         return False
     # Also reject if title is too short/generic (likely wrong match)
     if len(title) < 15:
@@ -875,6 +1169,23 @@ def _is_economics_paper(title: str, venue: str = "") -> bool:
     return True
 
 
+def _dig(d: Optional[dict], *keys: str, default=""):
+    """d[k1][k2]... from API JSON, or default if any level is missing or null."""
+    for key in keys:
+        if not isinstance(d, dict):
+            return default
+        d = d.get(key)
+    return default if d is None else d
+
+
+def _reconstruct_abstract(inv_index: dict) -> str:
+    """Rebuild abstract text from OpenAlex's {word: [positions]} inverted index."""
+    if not inv_index:
+        return ""
+    pos_word = {pos: word for word, positions in inv_index.items() for pos in positions}
+    return " ".join(pos_word[k] for k in sorted(pos_word))
+
+
 def _resolve_missing_metadata(candidate: dict, email: str) -> dict:
     """For candidates missing paper_title, try Semantic Scholar / OpenAlex."""
     if candidate.get("paper_title"):
@@ -891,35 +1202,28 @@ def _resolve_missing_metadata(candidate: dict, email: str) -> dict:
         if title and _is_economics_paper(title, venue):
             candidate["paper_title"] = title
             candidate["abstract"] = ss.get("abstract", "") or ""
-            oa = (ss.get("openAccessPdf") or {}).get("url", "")
+            oa = _dig(ss, "openAccessPdf", "url")
             if oa:
                 candidate["paper_url"] = oa
-            ext = ss.get("externalIds") or {}
-            candidate["doi"] = ext.get("DOI", "")
+            candidate["doi"] = _dig(ss, "externalIds", "DOI")
             log.info("      Found via Semantic Scholar: %s", title[:60])
             return candidate
         elif title:
             log.debug("      Rejected non-econ paper: %s", title[:60])
-    time.sleep(0.3)
 
     # Try OpenAlex
     oa_result = _search_openalex_by_author(name, email)
     if oa_result:
         title = oa_result.get("title", "")
-        source = ((oa_result.get("primary_location") or {}).get("source") or {}).get("display_name", "")
+        source = _dig(oa_result, "primary_location", "source", "display_name")
         if title and _is_economics_paper(title, source):
             candidate["paper_title"] = title
             inv = oa_result.get("abstract_inverted_index")
             if inv:
-                word_pos = []
-                for word, positions in inv.items():
-                    for pos in positions:
-                        word_pos.append((pos, word))
-                word_pos.sort()
-                candidate["abstract"] = " ".join(w for _, w in word_pos)[:2000]
-            oa_info = oa_result.get("open_access") or {}
-            if oa_info.get("oa_url"):
-                candidate["paper_url"] = oa_info["oa_url"]
+                candidate["abstract"] = _reconstruct_abstract(inv)[:2000]
+            oa_url = _dig(oa_result, "open_access", "oa_url")
+            if oa_url:
+                candidate["paper_url"] = oa_url
             candidate["doi"] = oa_result.get("doi", "") or ""
             log.info("      Found via OpenAlex: %s", title[:60])
             return candidate
@@ -935,28 +1239,17 @@ def _resolve_missing_metadata(candidate: dict, email: str) -> dict:
 # ================================================================
 
 def _make_id(title: str, authors: str = "") -> str:
-    raw = re.sub(r"\s+", " ", (title + authors).lower().strip())
+    raw = _WS_RE.sub(" ", (title + authors).lower().strip())
     return hashlib.sha256(raw.encode()).hexdigest()[:16]
 
 
-def _store_candidate(conn: sqlite3.Connection, candidate: dict, insert_fn) -> bool:
-    """Convert a candidate dict to a paper record and store it. Returns True if new."""
-    title = candidate.get("paper_title", "")
-    if not title:
-        return False
-
+def _candidate_paper(candidate: dict) -> dict:
+    """Paper record for a candidate that has a paper_title."""
+    title = candidate["paper_title"]
     name = candidate["name"]
     school = candidate["school"]
-    paper_id = _make_id(title, name)
-
-    existing = conn.execute(
-        "SELECT 1 FROM papers WHERE paper_id = ?", (paper_id,)
-    ).fetchone()
-    if existing:
-        return False
-
-    paper = {
-        "paper_id": paper_id,
+    return {
+        "paper_id": _make_id(title, name),
         "title": title,
         "authors": f"{name} ({school})",
         "abstract": candidate.get("abstract", "")[:2000],
@@ -968,8 +1261,75 @@ def _store_candidate(conn: sqlite3.Connection, candidate: dict, insert_fn) -> bo
         "pub_date": "",
         "relevant": 1,
     }
-    insert_fn(conn, paper)
-    return True
+
+
+# Ids per existence query, under SQLite's 999 bound-parameter limit
+ID_LOOKUP_CHUNK = 500
+
+
+def _store_candidates(conn: sqlite3.Connection, candidates: List[dict], insert_many) -> List[dict]:
+    """
+    Store the papers of candidates with a paper_title in one batch, skipping
+    ids already in the database or earlier in the list. Returns the
+    candidates that were added.
+    """
+    papers = {}  # paper_id -> (candidate, paper); the first candidate wins
+    for c in candidates:
+        if c.get("paper_title"):
+            paper = _candidate_paper(c)
+            papers.setdefault(paper["paper_id"], (c, paper))
+
+    ids = list(papers)
+    existing = set()
+    for i in range(0, len(ids), ID_LOOKUP_CHUNK):
+        chunk = ids[i:i + ID_LOOKUP_CHUNK]
+        existing.update(row[0] for row in conn.execute(
+            f"SELECT paper_id FROM papers WHERE paper_id IN ({', '.join('?' * len(chunk))})",
+            chunk,
+        ))
+
+    new = [(c, paper) for paper_id, (c, paper) in papers.items() if paper_id not in existing]
+    insert_many(conn, [paper for _, paper in new])
+    return [c for c, _ in new]
+
+
+# Department-specific parsers by DEPARTMENTS "parser" key; any other key
+# (i.e. "generic") uses _parse_generic
+PARSERS = {
+    "mit": _parse_mit,
+    "harvard": _parse_harvard,
+    "stanford": _parse_stanford,
+    "chicago": _parse_chicago,
+    "columbia": _parse_columbia,
+    "berkeley": _parse_berkeley,
+}
+
+
+def _scrape_department(dept: dict, url: str) -> List[dict]:
+    """Fetch one department's candidate page and run its parser."""
+    name = dept["name"]
+    parser = dept["parser"]
+    school = dept["school"]
+
+    log.info("Scraping %s (%s)...", name, url)
+    soup = _fetch_page(url)
+    if not soup:
+        log.warning("  Could not fetch %s — skipping", name)
+        return []
+
+    parse = PARSERS.get(parser)
+    candidates = parse(soup, url) if parse else _parse_generic(soup, url, school)
+
+    # Sanity check: a single department shouldn't have >30 candidates.
+    # If it does, the parser likely grabbed navigation/faculty garbage.
+    MAX_PER_DEPT = 30
+    if len(candidates) > MAX_PER_DEPT:
+        log.warning("  %s returned %d candidates (likely parser noise) — truncating to %d",
+                    name, len(candidates), MAX_PER_DEPT)
+        candidates = candidates[:MAX_PER_DEPT]
+
+    log.info("  Found %d candidates from %s", len(candidates), name)
+    return candidates
 
 
 # ================================================================
@@ -981,8 +1341,7 @@ def run(dry_run: bool = False) -> int:
     log.info("Literature Tracker — Automated JMP Scraper")
     log.info("=" * 60)
 
-    with open(CONFIG_PATH) as f:
-        cfg = yaml.safe_load(f)
+    cfg = _load_cfg(CONFIG_PATH.stat().st_mtime)
     email = cfg.get("email", "")
 
     # Allow overriding department URLs from config
@@ -1002,45 +1361,17 @@ def run(dry_run: bool = False) -> int:
 
     all_candidates = []
 
-    # Phase 1: Scrape all department pages
-    for dept in DEPARTMENTS:
-        name = dept["name"]
-        url = config_departments.get(name + " Economics", dept["url"])
-        parser = dept["parser"]
-        school = dept["school"]
-
-        log.info("Scraping %s (%s)...", name, url)
-        soup = _fetch_page(url)
-        if not soup:
-            log.warning("  Could not fetch %s — skipping", name)
-            continue
-
-        if parser == "mit":
-            candidates = _parse_mit(soup, url)
-        elif parser == "harvard":
-            candidates = _parse_harvard(soup, url)
-        elif parser == "stanford":
-            candidates = _parse_stanford(soup, url)
-        elif parser == "chicago":
-            candidates = _parse_chicago(soup, url)
-        elif parser == "columbia":
-            candidates = _parse_columbia(soup, url)
-        elif parser == "berkeley":
-            candidates = _parse_berkeley(soup, url)
-        else:
-            candidates = _parse_generic(soup, url, school)
-
-        # Sanity check: a single department shouldn't have >30 candidates.
-        # If it does, the parser likely grabbed navigation/faculty garbage.
-        MAX_PER_DEPT = 30
-        if len(candidates) > MAX_PER_DEPT:
-            log.warning("  %s returned %d candidates (likely parser noise) — truncating to %d",
-                        name, len(candidates), MAX_PER_DEPT)
-            candidates = candidates[:MAX_PER_DEPT]
-
-        log.info("  Found %d candidates from %s", len(candidates), name)
-        all_candidates.extend(candidates)
-        time.sleep(0.5)
+    # Phase 1: Scrape all department pages. Each department is a different
+    # host, so they are fetched concurrently; results keep DEPARTMENTS order.
+    workers = jm_cfg.get("concurrency", SCRAPE_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for candidates in ex.map(
+            lambda dept: _scrape_department(
+                dept, config_departments.get(dept["name"] + " Economics", dept["url"])
+            ),
+            DEPARTMENTS,
+        ):
+            all_candidates.extend(candidates)
 
     # Phase 1b: Also load any manual additions from YAML
     if JMP_MANUAL_PATH.exists():
@@ -1063,39 +1394,52 @@ def run(dry_run: bool = False) -> int:
     log.info("-" * 60)
     log.info("Total candidates scraped: %d", len(all_candidates))
 
+    # A candidate listed twice (e.g. scraped and also added by hand) would be
+    # looked up twice; keep the first listing
+    seen = set()
+    unique = []
+    for c in all_candidates:
+        key = (c["name"], c.get("paper_title", ""))
+        if key not in seen:
+            seen.add(key)
+            unique.append(c)
+    if len(unique) < len(all_candidates):
+        log.info("  Dropped %d duplicate listings", len(all_candidates) - len(unique))
+    all_candidates = unique
+
     # Phase 2: Resolve missing paper metadata
     candidates_with_title = sum(1 for c in all_candidates if c.get("paper_title"))
     candidates_without = [c for c in all_candidates if not c.get("paper_title")]
     log.info("  %d have paper titles, %d need API resolution",
              candidates_with_title, len(candidates_without))
 
+    to_resolve = []
     for c in candidates_without:
         if not _is_plausible_name(c["name"]):
             log.debug("  Skipping non-name: %s", c["name"])
             continue
-        _resolve_missing_metadata(c, email)
-        time.sleep(0.3)
+        to_resolve.append(c)
+    # Lookups are spaced per API by _pace, so the pool only overlaps latency;
+    # candidates are filled in place
+    with ThreadPoolExecutor(max_workers=RESOLVE_WORKERS) as ex:
+        list(ex.map(lambda c: _resolve_missing_metadata(c, email), to_resolve))
 
     # Final count
     final_with_title = sum(1 for c in all_candidates if c.get("paper_title"))
     log.info("After resolution: %d candidates with paper titles", final_with_title)
 
-    # Phase 3: Store in database
-    new_count = 0
-    for c in all_candidates:
-        if not c.get("paper_title"):
-            continue
-
-        if dry_run:
-            log.info("  [DRY] %s (%s): %s", c["name"], c["school"], c["paper_title"][:60])
-            new_count += 1
-            continue
-
-        if _store_candidate(conn, c, fetch_mod.insert_paper):
-            new_count += 1
+    # Phase 3: Store in database, all new papers in one transaction
+    if dry_run:
+        new_count = 0
+        for c in all_candidates:
+            if c.get("paper_title"):
+                log.info("  [DRY] %s (%s): %s", c["name"], c["school"], c["paper_title"][:60])
+                new_count += 1
+    else:
+        added = _store_candidates(conn, all_candidates, fetch_mod.insert_papers)
+        for c in added:
             log.info("  Added: %s (%s) — %s", c["name"], c["school"], c["paper_title"][:50])
-
-    if not dry_run:
+        new_count = len(added)
         conn.commit()
         conn.close()
 
@@ -7,10 +7,13 @@ Sends a macOS banner notification and optionally an email digest.
 import logging
 import os
 import smtplib
+import ssl
 import subprocess
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 import yaml
 
@@ -25,6 +28,13 @@ logging.basicConfig(
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_cfg(mtime: float) -> dict:
+    """Parsed config.yaml; keyed on its mtime so edits are picked up."""
+    with open(CONFIG_PATH) as f:
+        return yaml.safe_load(f)
+
+
 def send_macos_notification(title: str, message: str, subtitle: str = ""):
     """Post a native macOS notification banner."""
     script_parts = [f'display notification "{message}"']
@@ -50,12 +60,15 @@ def open_file_in_default_app(filepath: str):
         log.warning("Failed to open file: %s", e)
 
 
-def send_email(subject: str, body_md: str):
-    """Send the weekly reading list as an email (plain text + markdown body)."""
-    with open(CONFIG_PATH) as f:
-        cfg = yaml.safe_load(f)
-
-    email_cfg = cfg.get("notification", {}).get("email", {})
+def send_email(subject: str, body_md: str, email_cfg: Optional[dict] = None):
+    """
+    Send the weekly reading list as an email (plain text + markdown body).
+    email_cfg is the notification.email config section; read from
+    config.yaml when not given.
+    """
+    if email_cfg is None:
+        cfg = _load_cfg(CONFIG_PATH.stat().st_mtime)
+        email_cfg = cfg.get("notification", {}).get("email", {})
     if not email_cfg.get("enabled"):
         return
 
@@ -74,18 +87,29 @@ def send_email(subject: str, body_md: str):
         )
         return
 
+    # One address or a list; every recipient goes out over the same session
+    recipients = [recipient] if isinstance(recipient, str) else list(recipient)
+
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
     msg["From"] = sender
-    msg["To"] = recipient
+    msg["To"] = ", ".join(recipients)
     msg.attach(MIMEText(body_md, "plain", "utf-8"))
 
     try:
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
+        # Port 465 is TLS from the first byte, saving the STARTTLS round trip
+        if smtp_port == 465:
+            server = smtplib.SMTP_SSL(
+                smtp_server, smtp_port, context=ssl.create_default_context()
+            )
+        else:
+            server = smtplib.SMTP(smtp_server, smtp_port)
+        with server:
+            if smtp_port != 465:
+                server.starttls()
             server.login(sender, password)
-            server.sendmail(sender, [recipient], msg.as_string())
-        log.info("Email sent to %s", recipient)
+            server.sendmail(sender, recipients, msg.as_string())
+        log.info("Email sent to %s", ", ".join(recipients))
     except Exception as e:
         log.error("Email failed: %s", e)
 
@@ -97,10 +121,7 @@ def notify(reading_list_path: str, summary: str, body_md: str = ""):
     - Optionally open the reading list file
     - Optionally send email
     """
-    with open(CONFIG_PATH) as f:
-        cfg = yaml.safe_load(f)
-
-    notif_cfg = cfg.get("notification", {})
+    notif_cfg = _load_cfg(CONFIG_PATH.stat().st_mtime).get("notification", {})
 
     if notif_cfg.get("macos_banner", True):
         send_macos_notification(
@@ -118,4 +139,5 @@ def notify(reading_list_path: str, summary: str, body_md: str = ""):
         send_email(
             subject=f"Weekly Reading List — {week_str}",
             body_md=body_md,
+            email_cfg=notif_cfg["email"],
         )
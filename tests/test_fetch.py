@@ -0,0 +1,137 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("feedparser")
+pytest.importorskip("requests")
+pytest.importorskip("yaml")
+
+import requests  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "code"))
+fetch = importlib.import_module("01_fetch")
+
+FEED_URL = "https://example.org/feed"
+
+RSS2_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>Journal</title>
+    <item>
+      <title>Minimum Wages and Local Labor Markets</title>
+      <link>https://example.org/a</link>
+      <author>jdoe@example.org (Jane Doe)</author>
+      <description>An abstract.</description>
+      <pubDate>Mon, 06 Oct 2025 10:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Taxes and Firm Growth</title>
+      <link>https://example.org/b</link>
+      <author>Jane Doe &lt;jdoe@example.org&gt;</author>
+    </item>
+    <item>
+      <title>Trade and Migration</title>
+      <link>https://example.org/c</link>
+      <author>jdoe@example.org</author>
+    </item>
+    <item>
+      <title>Household Debt</title>
+      <link>https://example.org/d</link>
+      <author>John Roe</author>
+    </item>
+  </channel>
+</rss>
+"""
+
+RDF_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel rdf:about="https://example.org/feed">
+    <title>Journal</title>
+  </channel>
+  <item rdf:about="https://example.org/a">
+    <title>Minimum Wages and Local Labor Markets</title>
+    <link>https://example.org/a</link>
+    <dc:creator>Jane Doe</dc:creator>
+  </item>
+</rdf:RDF>
+"""
+
+
+class _Response:
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
+        self.headers = {"Content-Type": "application/xml; charset=utf-8"}
+        self.url = FEED_URL
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Serve a fixed body for every SESSION.get; returns the list of fetched URLs."""
+    calls = []
+
+    def install(content: bytes, status_code: int = 200):
+        def get(url, **kwargs):
+            calls.append(url)
+            return _Response(content, status_code)
+        monkeypatch.setattr(fetch.SESSION, "get", get)
+        return calls
+
+    return install
+
+
+def _authors_and_ids(papers):
+    return [(p["authors"], p["paper_id"]) for p in papers]
+
+
+def test_rss_author_matches_feedparser(serve, monkeypatch):
+    serve(RSS2_FEED)
+    fast = fetch.fetch_rss(FEED_URL, "Journal", None)
+    monkeypatch.setattr(fetch, "_fast_rss", lambda body: None)
+    slow = fetch.fetch_rss(FEED_URL, "Journal", None)
+
+    assert _authors_and_ids(fast) == _authors_and_ids(slow)
+    assert [p["authors"] for p in fast] == [
+        "Jane Doe", "Jane Doe", "jdoe@example.org", "John Roe",
+    ]
+
+
+def test_nber_author_matches_feedparser(serve, monkeypatch):
+    serve(RSS2_FEED)
+    feeds = [{"name": "NBER", "url": FEED_URL}]
+    fast = fetch.fetch_nber(feeds, None)
+    monkeypatch.setattr(fetch, "_fast_rss", lambda body: None)
+    slow = fetch.fetch_nber(feeds, None)
+
+    assert _authors_and_ids(fast) == _authors_and_ids(slow)
+
+
+def test_non_rss2_feed_is_downloaded_once(serve):
+    calls = serve(RDF_FEED)
+    papers = fetch.fetch_rss(FEED_URL, "Journal", None)
+
+    assert calls == [FEED_URL]
+    assert [(p["title"], p["authors"]) for p in papers] == [
+        ("Minimum Wages and Local Labor Markets", "Jane Doe"),
+    ]
+
+
+def test_http_error_is_not_refetched(serve, monkeypatch):
+    calls = serve(b"", status_code=503)
+
+    def no_refetch(*args, **kwargs):
+        raise AssertionError("feedparser should not fetch the feed again")
+
+    monkeypatch.setattr(fetch.feedparser, "parse", no_refetch)
+
+    assert fetch.fetch_rss(FEED_URL, "Journal", None) == []
+    assert fetch.fetch_nber([{"name": "NBER", "url": FEED_URL}], None) == []
+    assert calls == [FEED_URL, FEED_URL]